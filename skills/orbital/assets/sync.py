@@ -13,22 +13,63 @@ Usage:
 
     # Force full re-sync (ignore last_sync timestamp)
     python sync.py --force
+
+    # Fetch edition posts with more parallel connections (default 4)
+    python sync.py --jobs 8
+
+    # Time the quarterly renderer on a synthetic edition (no network)
+    python sync.py --benchmark 5000
 """
 
+from __future__ import annotations
+
+import argparse
+import codecs
+import hashlib
+import http.client
 import json
 import os
 import re
 import subprocess
 import sys
+import threading
+import time
+import urllib.error
 import urllib.parse
 import urllib.request
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from pathlib import Path
 
 SUPABASE_URL = "https://avlgvxtubpfmwtyhvsis.supabase.co"
 SUPABASE_KEY = "sb_publishable_K-FozEyE7nhPRcNJ7Jjy3w_a7fVN0B6"
 OP_ITEM_ID = "y3bbe4uwhmgy4sha32vzdplqpa"
+ORBITAL_URL = "https://orbital.nyc"
 ORBITAL_DIR = Path.home() / "Obsidian" / "cag" / "Orbital"
+POST_TYPES = ("win", "lesson", "poll")
+
+# Notes are requested for the days since the last sync plus this margin, so
+# the current period of every note type (a quarter at most) is included
+FULL_SPAN_DAYS = 3650
+SPAN_MARGIN_DAYS = 100
+# The API selects notes by period, not by updatedAt, so an edit to a note
+# older than the narrowed span would never be seen. The full span is
+# requested again once this many days have passed since the last full scan
+FULL_SCAN_DAYS = 30
+
+# A finalized edition is skipped without fetching its posts only if it was
+# last fetched within this many days, so late edits still show up
+EDITION_RECHECK_DAYS = 7
+
+CACHE_DIR = Path.home() / ".cache" / "orbital"
+# Supabase session cache (outside the vault, readable only by the user)
+SESSION_FILE = CACHE_DIR / "session.json"
+# HTML -> Markdown conversions, keyed by HTML hash
+HTML_CACHE_FILE = CACHE_DIR / "html_md.json"
+HTML_CACHE_MAX_ENTRIES = 5000
+# Renew a cached token this many seconds before it expires
+EXPIRY_MARGIN = 300
 
 # Map known promptIds to readable section headers.
 # Unknown promptIds get title-cased automatically.
@@ -55,68 +96,404 @@ PROMPT_LABELS = {
 INTENTION_PROMPTS = {"change", "sustain", "annual-reflection", "rituals"}
 TALK_PROMPTS = {"links", "questions", "ask", "give", "qol", "feedback"}
 
+# Quarterly update layout after Wins, in order: section heading, post type,
+# promptId groups (each rendered under its own ### label), and what happens
+# to posts of that type whose promptId has no group in any section:
+#   "plain"    - appended to this section without a heading
+#   "labelled" - appended to this section, each under its own ### label
+#   None       - not shown here
+# A section is omitted when it has no posts.
+QUARTERLY_SECTIONS = (
+    ("Lessons", "lesson", ("personal", "work", "field"), "plain"),
+    ("Intentions", "poll", tuple(sorted(INTENTION_PROMPTS)), None),
+    ("Talk", "poll", tuple(sorted(TALK_PROMPTS)), None),
+    ("Other", "poll", (), "labelled"),
+)
+
 
 try:
+    from importlib.metadata import PackageNotFoundError, version
     from markdownify import markdownify as _md
 
-    def html_to_md(html: str) -> str:
-        if not html or "<" not in html:
-            return html or ""
+    # Cached conversions are only valid for the same converter and options
+    try:
+        CONVERTER = f"markdownify {version('markdownify')} ATX -"
+    except PackageNotFoundError:
+        CONVERTER = "markdownify ATX -"
+
+    def convert_html(html: str) -> str:
         result = _md(html, heading_style="ATX", bullets="-")
         return re.sub(r"\n{3,}", "\n\n", result).strip()
 except ImportError:
-
-    def html_to_md(html: str) -> str:
+    CONVERTER = None
+
+    def convert_html(html: str) -> str:
+        return html
+
+
+class HtmlCache:
+    """Persistent LRU cache of HTML -> Markdown conversions, keyed by HTML hash."""
+
+    def __init__(self, path: Path = HTML_CACHE_FILE, max_entries: int = HTML_CACHE_MAX_ENTRIES):
+        self.path = path
+        self.max_entries = max_entries
+        self.entries: OrderedDict[str, str] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        try:
+            data = json.loads(path.read_text())
+            if data.get("converter") == CONVERTER:
+                self.entries.update(data.get("entries", {}))
+        except (OSError, json.JSONDecodeError):
+            pass
+        while len(self.entries) > max_entries:
+            self.entries.popitem(last=False)
+
+    def convert(self, html: str) -> str:
+        key = hashlib.sha256(html.encode()).hexdigest()[:32]
+        markdown = self.entries.get(key)
+        if markdown is not None:
+            self.hits += 1
+            self.entries.move_to_end(key)
+            return markdown
+        self.misses += 1
+        markdown = self.entries[key] = convert_html(html)
+        if len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+        return markdown
+
+    def save(self):
+        """Write entries oldest-first, so load order preserves recency."""
+        self.path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+        tmp = self.path.with_suffix(".tmp")
+        tmp.write_text(json.dumps({"converter": CONVERTER, "entries": self.entries}))
+        os.replace(tmp, self.path)
+
+
+# Set by main() for the duration of a run
+html_cache: HtmlCache | None = None
+
+
+def html_to_md(html: str) -> str:
+    if not html or "<" not in html:
         return html or ""
+    if html_cache is None or CONVERTER is None:
+        return convert_html(html)
+    return html_cache.convert(html)
 
 
-def op_get(field: str) -> str:
+def op_get(*fields: str) -> list[str]:
+    """Read fields from the 1Password item in a single op call."""
     result = subprocess.run(
-        ["op", "item", "get", OP_ITEM_ID, "--fields", field, "--reveal"],
+        ["op", "item", "get", OP_ITEM_ID, "--fields", ",".join(fields), "--reveal", "--format", "json"],
         capture_output=True, text=True,
     )
-    return result.stdout.strip()
+    items = json.loads(result.stdout or "[]")
+    if isinstance(items, dict):
+        items = [items]
+    values = {item.get("label") or item.get("id"): item.get("value", "") for item in items}
+    return [values.get(field, "") for field in fields]
 
 
-def get_token() -> str:
-    """Authenticate with Supabase via 1Password credentials."""
-    email = op_get("email")
-    password = op_get("password")
-
-    data = json.dumps({"email": email, "password": password}).encode()
+def auth_request(grant_type: str, payload: dict) -> dict:
     req = urllib.request.Request(
-        f"{SUPABASE_URL}/auth/v1/token?grant_type=password",
-        data=data,
+        f"{SUPABASE_URL}/auth/v1/token?grant_type={grant_type}",
+        data=json.dumps(payload).encode(),
         headers={
             "apikey": SUPABASE_KEY,
             "Content-Type": "application/json",
         },
     )
     resp = urllib.request.urlopen(req)
-    body = json.loads(resp.read())
+    return json.loads(resp.read())
+
+
+def load_session() -> dict:
+    try:
+        return json.loads(SESSION_FILE.read_text())
+    except (OSError, json.JSONDecodeError):
+        return {}
+
+
+def save_session(body: dict):
+    """Store access/refresh tokens and expiry in a file only the user can read."""
+    expires_at = body.get("expires_at") or int(time.time()) + int(body.get("expires_in", 3600))
+    session = {
+        "access_token": body["access_token"],
+        "refresh_token": body.get("refresh_token", ""),
+        "expires_at": expires_at,
+    }
+    SESSION_FILE.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+    tmp = SESSION_FILE.with_suffix(".tmp")
+    fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    with os.fdopen(fd, "w") as f:
+        json.dump(session, f)
+    os.chmod(tmp, 0o600)
+    os.replace(tmp, SESSION_FILE)
+
+
+def get_token(use_cache: bool = True) -> str:
+    """Get a Supabase access token.
+
+    Reuses the cached token while it is valid, renews it with the refresh
+    token grant once it expires, and only falls back to a password login
+    with 1Password credentials when there is no session or the refresh fails.
+    """
+    session = load_session() if use_cache else {}
+    if session.get("access_token") and session.get("expires_at", 0) - EXPIRY_MARGIN > time.time():
+        return session["access_token"]
+
+    if session.get("refresh_token"):
+        try:
+            body = auth_request("refresh_token", {"refresh_token": session["refresh_token"]})
+            if body.get("access_token"):
+                save_session(body)
+                return body["access_token"]
+        except urllib.error.URLError as e:
+            print(f"Token refresh failed ({e}), logging in again", file=sys.stderr)
+
+    email, password = op_get("email", "password")
+    body = auth_request("password", {"email": email, "password": password})
     token = body.get("access_token")
     if not token:
         print("Authentication failed:", body, file=sys.stderr)
         sys.exit(1)
+    save_session(body)
     return token
 
 
+# One keep-alive connection per (thread, scheme, host), reused across calls
+_connections = threading.local()
+
+
+def _connection(scheme: str, host: str) -> http.client.HTTPConnection:
+    pool = _connections.__dict__.setdefault("pool", {})
+    conn = pool.get((scheme, host))
+    if conn is None:
+        cls = http.client.HTTPSConnection if scheme == "https" else http.client.HTTPConnection
+        conn = pool[(scheme, host)] = cls(host, timeout=60)
+    return conn
+
+
+def _open(url: str, headers: dict) -> http.client.HTTPResponse:
+    """GET url on a reused connection, following redirects.
+
+    Reconnects once if the server dropped the idle connection. The caller
+    must read the returned response to the end before the next request.
+    """
+    for _ in range(10):
+        parts = urllib.parse.urlsplit(url)
+        path = parts.path + (f"?{parts.query}" if parts.query else "")
+        for attempt in range(2):
+            conn = _connection(parts.scheme, parts.netloc)
+            try:
+                conn.request("GET", path or "/", headers=headers)
+                resp = conn.getresponse()
+                break
+            except (http.client.HTTPException, ConnectionError):
+                conn.close()
+                if attempt:
+                    raise
+        if resp.status in (301, 302, 303, 307, 308) and resp.headers.get("Location"):
+            resp.read()
+            url = urllib.parse.urljoin(url, resp.headers["Location"])
+            continue
+        if resp.status >= 400:
+            resp.read()
+            raise urllib.error.HTTPError(url, resp.status, resp.reason, resp.headers, None)
+        return resp
+    raise urllib.error.HTTPError(url, resp.status, "Too many redirects", resp.headers, None)
+
+
 def api_get(token: str, path: str) -> dict:
-    url = f"https://orbital.nyc{path}"
-    req = urllib.request.Request(url, headers={"Authorization": f"Bearer {token}"})
-    resp = urllib.request.urlopen(req)
+    resp = _open(f"{ORBITAL_URL}{path}", {"Authorization": f"Bearer {token}"})
     return json.loads(resp.read())
 
 
-def write_file(filepath: Path, content: str) -> bool:
-    """Write file only if content changed. Returns True if written."""
+class CountingReader:
+    """Wraps a binary stream, counting the bytes read from it."""
+
+    def __init__(self, stream):
+        self.stream = stream
+        self.count = 0
+
+    def read(self, size: int = -1) -> bytes:
+        data = self.stream.read(size)
+        self.count += len(data)
+        return data
+
+
+def iter_json_list(stream, key: str, chunk_size: int = 1 << 16):
+    """Yield the items of the list at `key` in a JSON object, as they arrive.
+
+    Only one item (plus one chunk) is buffered at a time; each is decoded
+    with the C-accelerated JSONDecoder.raw_decode. Other top-level values
+    are skipped. The stream is read to the end.
+    """
+    decoder = json.JSONDecoder()
+    text = codecs.getincrementaldecoder("utf-8")()
+    buf, pos, eof = "", 0, False
+
+    def fill() -> bool:
+        nonlocal buf, pos, eof
+        if eof:
+            return False
+        chunk = stream.read(chunk_size)
+        eof = not chunk
+        buf = buf[pos:] + text.decode(chunk, final=eof)
+        pos = 0
+        return True
+
+    def skip(chars: str = " \t\r\n") -> str:
+        """Skip whitespace (and any of chars), returning the next character."""
+        nonlocal pos
+        while True:
+            while pos < len(buf) and buf[pos] in chars:
+                pos += 1
+            if pos < len(buf):
+                return buf[pos]
+            if not fill():
+                raise ValueError("Unexpected end of JSON")
+
+    def value():
+        """Decode the next complete value, reading more until it is complete."""
+        nonlocal pos
+        while True:
+            try:
+                result, end = decoder.raw_decode(buf, pos)
+                # A number cut off by the chunk ("8" of "8.5") also decodes,
+                # so only accept a value once the delimiter after it is here
+                if eof or (end < len(buf) and buf[end] in ",]}: \t\r\n"):
+                    pos = end
+                    return result
+            except json.JSONDecodeError:
+                if eof:
+                    raise
+            fill()
+
+    if skip() != "{":
+        raise ValueError("Expected a JSON object")
+    pos += 1
+    while skip(" \t\r\n,") != "}":
+        name = value()
+        skip()
+        pos += 1  # ":"
+        if skip() == "[" and name == key:
+            pos += 1
+            while skip(" \t\r\n,") != "]":
+                yield value()
+            pos += 1
+        else:
+            value()
+    while fill():
+        pass
+
+
+def api_get_list(token: str, path: str, key: str) -> tuple[list, int, float]:
+    """Stream-parse the list at `key` of a JSON response.
+
+    Returns (items, bytes received, seconds spent receiving and parsing).
+    """
+    start = time.perf_counter()
+    resp = _open(f"{ORBITAL_URL}{path}", {"Authorization": f"Bearer {token}"})
+    reader = CountingReader(resp)
+    items = list(iter_json_list(reader, key))
+    return items, reader.count, time.perf_counter() - start
+
+
+def notes_span(last_sync: str | None) -> int:
+    """Narrowest notes `span` (days) covering everything since last_sync."""
+    if not last_sync:
+        return FULL_SPAN_DAYS
+    try:
+        since = datetime.strptime(last_sync, "%Y-%m-%dT%H:%M:%SZ").replace(tzinfo=timezone.utc)
+    except ValueError:
+        return FULL_SPAN_DAYS
+    days = (datetime.now(timezone.utc) - since).days + 1
+    return max(1, min(FULL_SPAN_DAYS, days + SPAN_MARGIN_DAYS))
+
+
+def load_manifest(path: Path) -> dict:
+    """Output manifest: file name -> sha256, size and mtime_ns of what we wrote."""
+    try:
+        return json.loads(path.read_text())
+    except (OSError, json.JSONDecodeError):
+        return {}
+
+
+def write_json_atomic(path: Path, data: dict):
+    """Write JSON via a temp file and rename, so a crash never leaves it truncated."""
+    tmp = path.with_name(f"{path.name}.tmp")
+    tmp.write_text(json.dumps(data, indent=2, sort_keys=True))
+    os.replace(tmp, path)
+
+
+def write_file(filepath: Path, content: str, manifest: dict | None = None) -> bool:
+    """Write file only if content changed. Returns True if written.
+
+    With a manifest, a file whose recorded hash matches the new content and
+    whose size and mtime are unchanged since we wrote it is skipped after a
+    single stat. Files without an entry, or touched since (e.g. edited in
+    Obsidian), are compared by reading them as before. Writes go through a
+    hidden temp file and a rename, so a note is never seen half-written.
+    """
     filepath.parent.mkdir(parents=True, exist_ok=True)
-    if filepath.exists() and filepath.read_text() == content:
-        return False
-    filepath.write_text(content)
+    data = content.encode()
+    digest = hashlib.sha256(data).hexdigest()
+    entry = (manifest or {}).get(filepath.name)
+
+    try:
+        st = filepath.stat()
+    except FileNotFoundError:
+        st = None
+    if st is not None:
+        if entry and (entry["size"], entry["mtime_ns"]) == (st.st_size, st.st_mtime_ns):
+            if entry["sha256"] == digest:
+                return False
+        elif st.st_size == len(data) and filepath.read_bytes() == data:
+            if manifest is not None:
+                manifest[filepath.name] = {"sha256": digest, "size": st.st_size, "mtime_ns": st.st_mtime_ns}
+            return False
+
+    tmp = filepath.with_name(f".{filepath.name}.tmp")
+    tmp.write_bytes(data)
+    os.replace(tmp, filepath)
+    if manifest is not None:
+        st = filepath.stat()
+        manifest[filepath.name] = {"sha256": digest, "size": st.st_size, "mtime_ns": st.st_mtime_ns}
     return True
 
 
+def days_since(stamp: str) -> float | None:
+    """Days elapsed since a "%Y-%m-%dT%H:%M:%SZ" timestamp, or None if unparseable."""
+    try:
+        then = datetime.strptime(stamp, "%Y-%m-%dT%H:%M:%SZ").replace(tzinfo=timezone.utc)
+    except (TypeError, ValueError):
+        return None
+    return (datetime.now(timezone.utc) - then).total_seconds() / 86400
+
+
+def load_edition_index(path: Path) -> dict:
+    """Per-edition record of the last fetch: when, latest post timestamp, finalized, tasks hash."""
+    try:
+        return json.loads(path.read_text())
+    except (OSError, json.JSONDecodeError):
+        return {}
+
+
+def posts_updated_at(posts: list) -> str:
+    """Latest timestamp on any post (updatedAt, finalizedAt or dateCreated)."""
+    stamps = [
+        p.get(key) or "" for p in posts for key in ("updatedAt", "finalizedAt", "dateCreated")
+    ]
+    return max(stamps, default="")
+
+
+def tasks_fingerprint(tasks: list) -> str:
+    """Hash of an edition's task history entries, which change when a task does."""
+    return hashlib.sha256(json.dumps(tasks, sort_keys=True).encode()).hexdigest()[:16]
+
+
 def render_post(post: dict) -> list[str]:
     """Render a single post (win/lesson/poll) to markdown lines."""
     lines = []
@@ -135,6 +512,29 @@ def render_post(post: dict) -> list[str]:
     return lines
 
 
+def prompt_label(pid: str) -> str:
+    return PROMPT_LABELS.get(pid, pid.replace("-", " ").title())
+
+
+def bucket_posts(posts_by_type: dict[str, list]) -> tuple[dict, dict]:
+    """Split posts by promptId in one pass over each type's posts.
+
+    Returns ({(type, promptId): posts}, {type: posts without a group}),
+    keeping the original post order within each list.
+    """
+    grouped_prompts = {(ptype, pid) for _, ptype, pids, _ in QUARTERLY_SECTIONS for pid in pids}
+    groups: dict[tuple[str, str], list] = {}
+    unmatched: dict[str, list] = {}
+    for ptype, posts in posts_by_type.items():
+        for p in posts:
+            key = (ptype, p.get("promptId"))
+            if key in grouped_prompts:
+                groups.setdefault(key, []).append(p)
+            else:
+                unmatched.setdefault(ptype, []).append(p)
+    return groups, unmatched
+
+
 def build_log_note(note: dict) -> str:
     """Build markdown for a reflection log note."""
     ntype = note["type"]
@@ -223,72 +623,66 @@ def build_quarterly_update(
                 lines.append(f"[Link]({url})")
                 lines.append("")
 
-    # Lessons — group by known promptIds, then catch uncategorized
-    if lesson_posts:
-        lines.append("## Lessons")
-        lines.append("")
-        seen = set()
-        for pid in ["personal", "work", "field"]:
-            matching = [p for p in lesson_posts if p.get("promptId") == pid]
+    groups, unmatched = bucket_posts({"lesson": lesson_posts, "poll": poll_posts})
+    for heading, ptype, pids, rest in QUARTERLY_SECTIONS:
+        section = []
+        has_posts = False
+        for pid in pids:
+            matching = groups.get((ptype, pid))
             if matching:
-                seen.update(p["id"] for p in matching)
-                lines.append(f"### {PROMPT_LABELS[pid]}")
-                lines.append("")
+                has_posts = True
+                section.append(f"### {prompt_label(pid)}")
+                section.append("")
                 for p in matching:
-                    lines.extend(render_post(p))
-        uncategorized = [p for p in lesson_posts if p["id"] not in seen]
-        if uncategorized:
-            for p in uncategorized:
-                lines.extend(render_post(p))
+                    section.extend(render_post(p))
+        for p in unmatched.get(ptype, []) if rest else []:
+            has_posts = True
+            if rest == "labelled":
+                section.append(f"### {prompt_label(p.get('promptId') or 'uncategorized')}")
+                section.append("")
+            section.extend(render_post(p))
+        if has_posts:
+            lines.append(f"## {heading}")
+            lines.append("")
+            lines.extend(section)
 
-    # Intentions
-    intention_posts = [p for p in poll_posts if p.get("promptId") in INTENTION_PROMPTS]
-    if intention_posts:
-        lines.append("## Intentions")
-        lines.append("")
-        seen = set()
-        for pid in sorted(INTENTION_PROMPTS):
-            matching = [p for p in intention_posts if p.get("promptId") == pid]
-            if matching:
-                seen.update(p["id"] for p in matching)
-                lines.append(f"### {PROMPT_LABELS.get(pid, pid.replace('-', ' ').title())}")
-                lines.append("")
-                for p in matching:
-                    lines.extend(render_post(p))
+    return "\n".join(lines)
 
-    # Talk
-    talk_posts = [p for p in poll_posts if p.get("promptId") in TALK_PROMPTS]
-    if talk_posts:
-        lines.append("## Talk")
-        lines.append("")
-        seen = set()
-        for pid in sorted(TALK_PROMPTS):
-            matching = [p for p in talk_posts if p.get("promptId") == pid]
-            if matching:
-                seen.update(p["id"] for p in matching)
-                lines.append(f"### {PROMPT_LABELS.get(pid, pid.replace('-', ' ').title())}")
-                lines.append("")
-                for p in matching:
-                    lines.extend(render_post(p))
 
-    # Catch any poll posts with unknown promptIds
-    known_poll_ids = INTENTION_PROMPTS | TALK_PROMPTS
-    other = [p for p in poll_posts if p.get("promptId") not in known_poll_ids]
-    if other:
-        lines.append("## Other")
-        lines.append("")
-        for p in other:
-            pid = p.get("promptId") or "uncategorized"
-            label = PROMPT_LABELS.get(pid, pid.replace("-", " ").title())
-            lines.append(f"### {label}")
-            lines.append("")
-            lines.extend(render_post(p))
+def benchmark_render(posts: int, repeat: int = 5):
+    """Time build_quarterly_update on a synthetic edition with posts per type."""
+    pids = list(PROMPT_LABELS) + [None, "new-prompt"]
 
-    return "\n".join(lines)
+    def synthetic(ptype: str) -> list:
+        return [
+            {"id": f"{ptype}-{i}", "type": ptype, "lead": f"Lead {i}", "body": f"Body {i}",
+             "url": "", "promptId": pids[i % len(pids)]}
+            for i in range(posts)
+        ]
+
+    wins, lessons, polls = synthetic("win"), synthetic("lesson"), synthetic("poll")
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        content = build_quarterly_update("Q1 2026", "2026-Q1", wins, lessons, polls)
+        timings.append(time.perf_counter() - start)
+    print(f"Rendered {3 * posts} posts ({len(content):,} chars)")
+    print(f"  best {min(timings) * 1000:.1f} ms, mean {sum(timings) / repeat * 1000:.1f} ms over {repeat} runs")
 
 
 def main():
-    force = "--force" in sys.argv
+    parser = argparse.ArgumentParser(description="Back up Orbital.nyc reflections to Obsidian")
+    parser.add_argument("--force", action="store_true", help="Ignore the last sync timestamp")
+    parser.add_argument("--jobs", type=int, default=4,
+                        help="Parallel connections for edition posts (default: 4)")
+    parser.add_argument("--benchmark", type=int, metavar="POSTS",
+                        help="Time the quarterly renderer with POSTS synthetic posts per type, then exit")
+    args = parser.parse_args()
+
+    if args.benchmark:
+        benchmark_render(args.benchmark)
+        return
+    force = args.force
     ORBITAL_DIR.mkdir(parents=True, exist_ok=True)
 
     last_sync_file = ORBITAL_DIR / ".last_sync"
@@ -296,25 +690,53 @@ def main():
         last_sync = last_sync_file.read_text().strip()
     else:
         last_sync = None
+    last_full_scan_file = ORBITAL_DIR / ".last_full_scan"
+    last_full_scan = last_full_scan_file.read_text().strip() if last_full_scan_file.exists() else ""
+
+    edition_index_file = ORBITAL_DIR / ".editions.json"
+    edition_index = load_edition_index(edition_index_file)
+    manifest_file = ORBITAL_DIR / ".manifest.json"
+    manifest = load_manifest(manifest_file)
+
+    global html_cache
+    html_cache = HtmlCache()
 
     print("Authenticating...")
     token = get_token()
 
     # Get member ID (for quarterly updates)
-    member = api_get(token, "/api/account/member")
+    try:
+        member = api_get(token, "/api/account/member")
+    except urllib.error.HTTPError as e:
+        if e.code != 401:
+            raise
+        # Cached session was revoked: log in again
+        token = get_token(use_cache=False)
+        member = api_get(token, "/api/account/member")
     member_id = member["member"]["id"]
     print(f"Member: {member['member'].get('name', member_id)}")
 
-    # === Log Notes ===
-    print("\nFetching log notes...")
-    notes_data = api_get(
+    # Notes and edition history in parallel
+    pool = ThreadPoolExecutor(max_workers=max(1, args.jobs))
+    full_scan_age = days_since(last_full_scan)
+    if full_scan_age is None or full_scan_age >= FULL_SCAN_DAYS:
+        span = FULL_SPAN_DAYS
+    else:
+        span = notes_span(last_sync)
+    notes_future = pool.submit(
+        api_get_list,
         token,
-        "/api/account/notes?span=3650&includeIncomplete=false"
+        f"/api/account/notes?span={span}&includeIncomplete=false"
         "&weekStartDay=1&workweekLength=5&timezone=America/New_York"
         "&types=weekly,monthly,quarterly",
+        "notes",
     )
-    notes = notes_data.get("notes", [])
-    print(f"Found {len(notes)} log notes")
+    history_future = pool.submit(api_get, token, "/api/networks/member/tasks/history")
+
+    # === Log Notes ===
+    print(f"\nFetching log notes (last {span} days)...")
+    notes, payload_bytes, seconds = notes_future.result()
+    print(f"Found {len(notes)} log notes ({payload_bytes / 1024:.0f} KB, received and parsed in {seconds:.2f}s)")
 
     written = 0
     skipped = 0
@@ -329,7 +751,7 @@ def main():
 
         filepath = ORBITAL_DIR / f"{period}.md"
         content = build_log_note(note)
-        if write_file(filepath, content):
+        if write_file(filepath, content, manifest):
             print(f"  Wrote: {filepath.name}")
             written += 1
         else:
@@ -337,49 +759,98 @@ def main():
             skipped += 1
 
     print(f"Log notes: {written} written, {skipped} skipped")
+    if CONVERTER is not None:
+        print(f"HTML conversions: {html_cache.hits} cached, {html_cache.misses} converted")
+        if html_cache.hits or html_cache.misses:
+            html_cache.save()
 
     # === Quarterly Updates ===
     print("\nFetching quarterly updates...")
-    history = api_get(token, "/api/networks/member/tasks/history")
-    editions = sorted(
-        set(t["networkEdition"].removeprefix("1:") for t in history.get("tasks", []))
-    )
+    history = history_future.result()
+    edition_tasks: dict[str, list] = {}
+    for t in history.get("tasks", []):
+        edition_tasks.setdefault(t["networkEdition"].removeprefix("1:"), []).append(t)
+    editions = sorted(edition_tasks)
     print(f"Found {len(editions)} editions: {editions}")
 
-    written_updates = 0
+    quarters = {}
     for edition in editions:
         parts = edition.split()
         if len(parts) == 2:
             quarter = f"{parts[1]}-{parts[0]}"
         else:
             quarter = edition
-
-        enc = urllib.parse.quote(edition)
-        wins = api_get(token, f"/api/networks/member/posts/user/{member_id}?type=win&edition={enc}")
-        lessons = api_get(token, f"/api/networks/member/posts/user/{member_id}?type=lesson&edition={enc}")
-        polls = api_get(token, f"/api/networks/member/posts/user/{member_id}?type=poll&edition={enc}")
-
-        win_posts = wins.get("posts", [])
-        lesson_posts = lessons.get("posts", [])
-        poll_posts = polls.get("posts", [])
-
-        if not win_posts and not lesson_posts and not poll_posts:
+        quarters[edition] = quarter
+
+    # An edition is unchanged if every post was finalized and none changed
+    # after the last sync, and its task history entries are the same. The
+    # posts API has no cheaper freshness check, so a record is only trusted
+    # for EDITION_RECHECK_DAYS; after that the edition is fetched again.
+    def unchanged(edition: str) -> bool:
+        record = edition_index.get(edition)
+        if not (last_sync and record):
+            return False
+        age = days_since(record.get("fetchedAt", ""))
+        return bool(
+            age is not None and age < EDITION_RECHECK_DAYS
+            and record.get("finalized")
+            and record.get("updatedAt", "") <= last_sync
+            and record.get("tasks") == tasks_fingerprint(edition_tasks[edition])
+            and (ORBITAL_DIR / f"{quarters[edition]}-update.md").exists()
+        )
+
+    to_fetch = [e for e in editions if not unchanged(e)]
+    unchanged_count = len(editions) - len(to_fetch)
+
+    # Fetch every (edition, type) in parallel over reused connections
+    futures = {
+        (edition, ptype): pool.submit(
+            api_get,
+            token,
+            f"/api/networks/member/posts/user/{member_id}"
+            f"?type={ptype}&edition={urllib.parse.quote(edition)}",
+        )
+        for edition in to_fetch
+        for ptype in POST_TYPES
+    }
+
+    fetched_at = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+    written_updates = 0
+    for edition in to_fetch:
+        quarter = quarters[edition]
+        win_posts, lesson_posts, poll_posts = (
+            futures[(edition, ptype)].result().get("posts", []) for ptype in POST_TYPES
+        )
+        all_posts = win_posts + lesson_posts + poll_posts
+        edition_index[edition] = {
+            "fetchedAt": fetched_at,
+            "updatedAt": posts_updated_at(all_posts),
+            "finalized": all(p.get("finalized") for p in all_posts),
+            "tasks": tasks_fingerprint(edition_tasks[edition]),
+        }
+
+        if not all_posts:
             print(f"  Skipping {edition} (no content)")
             continue
 
         filepath = ORBITAL_DIR / f"{quarter}-update.md"
         content = build_quarterly_update(edition, quarter, win_posts, lesson_posts, poll_posts)
-        if write_file(filepath, content):
+        if write_file(filepath, content, manifest):
             print(f"  Wrote: {filepath.name} ({len(win_posts)}W {len(lesson_posts)}L {len(poll_posts)}P)")
             written_updates += 1
         else:
             print(f"  Unchanged: {filepath.name}")
 
-    print(f"Quarterly updates: {written_updates} written")
+    pool.shutdown()
+    print(f"Quarterly updates: {written_updates} written, {unchanged_count} editions unchanged since last sync")
 
     # Update last sync timestamp
     now = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+    write_json_atomic(edition_index_file, edition_index)
+    write_json_atomic(manifest_file, manifest)
     last_sync_file.write_text(now)
+    if span == FULL_SPAN_DAYS:
+        last_full_scan_file.write_text(now)
     print(f"\nSync complete. Timestamp: {now}")
 
 
@@ -0,0 +1,35 @@
+"""
+Golden tests for the quarterly update renderer.
+
+golden/editions.json holds the input editions and golden/<name>.md the
+Markdown the renderer produced for each before the single-pass bucketing
+(bucket_posts) replaced the per-prompt scans. Any change to the layout
+shows up as a diff against these files.
+
+Run with:
+    python -m pytest skills/orbital/tests
+"""
+
+import importlib.util
+import json
+from pathlib import Path
+
+import pytest
+
+GOLDEN_DIR = Path(__file__).parent / "golden"
+SYNC_PATH = Path(__file__).parent.parent / "assets" / "sync.py"
+
+spec = importlib.util.spec_from_file_location("orbital_sync", SYNC_PATH)
+sync = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(sync)
+
+EDITIONS = json.loads((GOLDEN_DIR / "editions.json").read_text())
+
+
+@pytest.mark.parametrize("case", EDITIONS, ids=[case["name"] for case in EDITIONS])
+def test_build_quarterly_update_matches_golden(case):
+    expected = (GOLDEN_DIR / f"{case['name']}.md").read_text()
+    rendered = sync.build_quarterly_update(
+        case["edition"], case["quarter"], case["wins"], case["lessons"], case["polls"]
+    )
+    assert rendered == expected
@@ -2,31 +2,58 @@
 /**
  * Backup all reMarkable documents
  *
+ * Backups are incremental and content-addressed. Each document archive is
+ * stored once under its document hash, and each run writes a dated snapshot
+ * manifest pointing at those blobs:
+ *
+ *   data/backups/
+ *   ├── blobs/ab/abcdef....zip              # one per document version
+ *   ├── blobs/ab/abcdef...-original.pdf     # with --include-original
+ *   └── snapshots/2026-01-25/manifest.json  # what the library looked like
+ *
+ * Documents whose hash is already in the store are not downloaded again, so
+ * a backup of an unchanged library only writes a new manifest. Changed
+ * documents download in parallel under a rate limit that backs off when the
+ * server pushes back and recovers as requests succeed.
+ *
+ * --output keeps the original flat layout: every document is downloaded as
+ * <name>-<hash8>.zip into the given folder, next to its manifest.json.
+ *
  * Usage:
  *   npx tsx backup.ts
- *   npx tsx backup.ts --output ./backups
- *   npx tsx backup.ts --include-original  # Also download original PDFs
+ *   npx tsx backup.ts --store ./backups       # Store root (default data/backups)
+ *   npx tsx backup.ts --output ./2026-01-25   # Flat folder of ZIPs (no store)
+ *   npx tsx backup.ts --include-original      # Also download original PDFs
+ *   npx tsx backup.ts --concurrency 8         # Parallel downloads (default 4)
  */
 
-import { initApi, safeName, today, getFolders, getPath } from "./common.js";
-import { writeFile, mkdir } from "fs/promises";
-import { join } from "path";
-import type { Entry } from "rmapi-js";
+import { initApi, listItemsCached, mapConcurrent, safeName, today, getFolders, getPath } from "./common.js";
+import { writeFile, readFile, mkdir, rename, access, readdir } from "fs/promises";
+import { join, relative } from "path";
+import { HashNotFoundError, ResponseError } from "rmapi-js";
 
 interface BackupOptions {
+  /** Flat backup folder (original layout) */
   output?: string;
+  /** Content-addressed store root */
+  store?: string;
   includeOriginal?: boolean;
+  concurrency: number;
 }
 
 function parseArgs(): BackupOptions {
   const args = process.argv.slice(2);
-  const options: BackupOptions = {};
+  const options: BackupOptions = { concurrency: 4 };
 
   for (let i = 0; i < args.length; i++) {
     if (args[i] === "--output" && args[i + 1]) {
       options.output = args[++i];
+    } else if (args[i] === "--store" && args[i + 1]) {
+      options.store = args[++i];
     } else if (args[i] === "--include-original") {
       options.includeOriginal = true;
+    } else if (args[i] === "--concurrency" && args[i + 1]) {
+      options.concurrency = Math.max(1, parseInt(args[++i], 10) || 1);
     }
   }
 
@@ -38,8 +65,13 @@ interface ManifestEntry {
   hash: string;
   parent: string | undefined;
   path: string;
+  /** Archive path, relative to the snapshot (or --output) directory */
   file: string;
   originalFile?: string;
+  /** Set once originals were looked for, so notebooks aren't retried nightly */
+  originalChecked?: boolean;
+  /** True if the archive was already in the store */
+  reused?: boolean;
   error?: string;
 }
 
@@ -48,9 +80,89 @@ interface Manifest {
   documentCount: number;
   successCount: number;
   errorCount: number;
+  downloadedCount: number;
+  reusedCount: number;
   documents: ManifestEntry[];
 }
 
+/**
+ * Spaces out request starts, backing off on 429/5xx responses
+ *
+ * The delay doubles (up to 30s) whenever the server rejects a request for
+ * load reasons and decays by 10% after every success, so a healthy server
+ * sees full concurrency while a throttling one is slowed down.
+ */
+class AdaptiveRateLimit {
+  delay = 0;
+  private nextStart = 0;
+
+  async wait(): Promise<void> {
+    const now = Date.now();
+    const start = Math.max(now, this.nextStart);
+    this.nextStart = start + this.delay;
+    if (start > now) await new Promise((r) => setTimeout(r, start - now));
+  }
+
+  /** Run fn under the limit, retrying throttled requests up to 5 times */
+  async run<T>(fn: () => Promise<T>): Promise<T> {
+    for (let attempt = 1; ; attempt++) {
+      await this.wait();
+      try {
+        const result = await fn();
+        this.delay = Math.floor(this.delay * 0.9);
+        return result;
+      } catch (error) {
+        const status = error instanceof ResponseError ? error.status : 0;
+        if ((status === 429 || status >= 500) && attempt < 5) {
+          this.delay = Math.min(30_000, Math.max(250, this.delay * 2));
+          continue;
+        }
+        throw error;
+      }
+    }
+  }
+}
+
+async function exists(path: string): Promise<boolean> {
+  try {
+    await access(path);
+    return true;
+  } catch {
+    return false;
+  }
+}
+
+/** Write via a temp file so an interrupted download never leaves a partial blob */
+async function writeAtomic(path: string, data: Uint8Array | string): Promise<void> {
+  const tmpPath = `${path}.${process.pid}.tmp`;
+  await writeFile(tmpPath, data);
+  await rename(tmpPath, path);
+}
+
+/** Successful entries of the latest earlier snapshot, keyed by document hash */
+async function loadPreviousEntries(snapshotsDir: string, current: string): Promise<Map<string, ManifestEntry>> {
+  const previous = new Map<string, ManifestEntry>();
+  let dates: string[];
+  try {
+    dates = (await readdir(snapshotsDir)).filter((d) => d !== current).sort().reverse();
+  } catch {
+    return previous;
+  }
+
+  for (const date of dates) {
+    try {
+      const manifest: Manifest = JSON.parse(await readFile(join(snapshotsDir, date, "manifest.json"), "utf-8"));
+      for (const entry of manifest.documents) {
+        if (!entry.error) previous.set(entry.hash, entry);
+      }
+      break;
+    } catch {
+      // Unreadable snapshot: fall back to the one before
+    }
+  }
+  return previous;
+}
+
 async function main() {
   const options = parseArgs();
 
@@ -59,96 +171,118 @@ async function main() {
   // Initialize API
   const api = await initApi();
 
-  // Get all documents (force refresh)
+  // Get all documents (cache is validated against the cloud root hash)
   console.log("Fetching document list...");
-  const items = await api.listItems(true);
+  const items = await listItemsCached(api);
   const documents = items.filter((i) => i.type === "DocumentType" && i.parent !== "trash");
   const folders = getFolders(items);
 
   console.log(`Found ${documents.length} documents\n`);
 
-  // Create backup directory
-  const backupDir = options.output || join("data", "downloads", `${today()}-backup`);
-  await mkdir(backupDir, { recursive: true });
+  // Blobs are shared by every snapshot; snapshots are one manifest per day.
+  // With --output, archives and manifest go flat into that folder instead.
+  const flat = options.output !== undefined;
+  const storeDir = options.store || join("data", "backups");
+  const blobsDir = join(storeDir, "blobs");
+  const snapshotsDir = join(storeDir, "snapshots");
+  const snapshotDir = options.output ?? join(snapshotsDir, today());
+  await mkdir(snapshotDir, { recursive: true });
+
+  const previous = flat ? new Map<string, ManifestEntry>() : await loadPreviousEntries(snapshotsDir, today());
 
   const manifest: Manifest = {
     backupDate: new Date().toISOString(),
     documentCount: documents.length,
     successCount: 0,
     errorCount: 0,
+    downloadedCount: 0,
+    reusedCount: 0,
     documents: [],
   };
 
-  // Download each document
-  for (let i = 0; i < documents.length; i++) {
-    const doc = documents[i];
-    const progress = `[${i + 1}/${documents.length}]`;
-    const path = getPath(doc, folders);
+  const limiter = new AdaptiveRateLimit();
+  let finished = 0;
+
+  // Download changed documents, options.concurrency at a time
+  manifest.documents = await mapConcurrent(documents, options.concurrency, async (doc) => {
+    const blobDir = flat ? snapshotDir : join(blobsDir, doc.hash.slice(0, 2));
+    const baseName = flat ? `${safeName(doc.visibleName)}-${doc.hash.slice(0, 8)}` : doc.hash;
+    const blobPath = join(blobDir, `${baseName}.zip`);
+    const earlier = previous.get(doc.hash);
 
     const entry: ManifestEntry = {
       name: doc.visibleName,
       hash: doc.hash,
       parent: doc.parent,
-      path,
-      file: "",
+      path: getPath(doc, folders),
+      file: relative(snapshotDir, blobPath),
     };
 
     try {
-      process.stdout.write(`${progress} ${doc.visibleName}...`);
-
-      // Download ZIP archive
-      const zipData = await api.getDocument(doc.hash);
-      const safeDocName = safeName(doc.visibleName);
-      const fileName = `${safeDocName}-${doc.hash.slice(0, 8)}.zip`;
-      const filePath = join(backupDir, fileName);
-      await writeFile(filePath, zipData);
-      entry.file = fileName;
-
-      // Download original if requested
-      if (options.includeOriginal) {
-        try {
-          const pdfData = await api.getPdf(doc.hash);
-          const originalFileName = `${safeDocName}-${doc.hash.slice(0, 8)}-original.pdf`;
-          await writeFile(join(backupDir, originalFileName), pdfData);
-          entry.originalFile = originalFileName;
-        } catch {
-          // No original PDF available (notebook or EPUB)
+      await mkdir(blobDir, { recursive: true });
+
+      // Download ZIP archive unless this version is already stored
+      if (!flat && (await exists(blobPath))) {
+        entry.reused = true;
+        manifest.reusedCount++;
+      } else {
+        const zipData = await limiter.run(() => api.getDocument(doc.hash));
+        await writeAtomic(blobPath, zipData);
+        manifest.downloadedCount++;
+      }
+
+      // Download original if requested (once per document version)
+      if (options.includeOriginal && earlier?.originalChecked) {
+        entry.originalFile = earlier.originalFile;
+        entry.originalChecked = true;
+      } else if (options.includeOriginal) {
+        // The listing says which original a document has; notebooks have none
+        const fileType = "fileType" in doc ? doc.fileType : undefined;
+        const fetchOriginal =
+          fileType === "pdf" ? () => api.getPdf(doc.hash)
+          : fileType === "epub" ? () => api.getEpub(doc.hash)
+          : undefined;
+        if (fetchOriginal) {
+          const originalPath = join(blobDir, `${baseName}-original.${fileType}`);
           try {
-            const epubData = await api.getEpub(doc.hash);
-            const originalFileName = `${safeDocName}-${doc.hash.slice(0, 8)}-original.epub`;
-            await writeFile(join(backupDir, originalFileName), epubData);
-            entry.originalFile = originalFileName;
-          } catch {
-            // Pure notebook, no original
+            if (flat || !(await exists(originalPath))) {
+              await writeAtomic(originalPath, await limiter.run(fetchOriginal));
+            }
+            entry.originalFile = relative(snapshotDir, originalPath);
+          } catch (error) {
+            // Only a definite not-found means "no original"; other failures
+            // (network, 429/5xx after retries) fail the entry and are retried
+            const notFound =
+              error instanceof HashNotFoundError || (error instanceof ResponseError && error.status === 404);
+            if (!notFound) throw error;
           }
         }
+        if (fileType) entry.originalChecked = true;
       }
 
-      console.log(" done");
       manifest.successCount++;
     } catch (error) {
-      console.log(" FAILED");
       entry.error = error instanceof Error ? error.message : "Unknown error";
       manifest.errorCount++;
     }
 
-    manifest.documents.push(entry);
-
-    // Rate limiting - small delay between downloads
-    await new Promise((r) => setTimeout(r, 200));
-  }
+    finished++;
+    const status = entry.error ? "FAILED" : entry.reused ? "unchanged" : "downloaded";
+    console.log(`[${finished}/${documents.length}] ${doc.visibleName}... ${status}`);
+    return entry;
+  });
 
   // Save manifest
-  const manifestPath = join(backupDir, "manifest.json");
-  await writeFile(manifestPath, JSON.stringify(manifest, null, 2));
+  const manifestPath = join(snapshotDir, "manifest.json");
+  await writeAtomic(manifestPath, JSON.stringify(manifest, null, 2));
 
   // Summary
   console.log("\n" + "=".repeat(50));
   console.log("Backup Complete!");
   console.log("=".repeat(50));
-  console.log(`Location: ${backupDir}`);
+  console.log(`Location: ${snapshotDir}`);
   console.log(`Total documents: ${manifest.documentCount}`);
-  console.log(`Successful: ${manifest.successCount}`);
+  console.log(`Successful: ${manifest.successCount} (${manifest.downloadedCount} downloaded, ${manifest.reusedCount} unchanged)`);
   if (manifest.errorCount > 0) {
     console.log(`Failed: ${manifest.errorCount}`);
     console.log("\nFailed documents:");
@@ -1,11 +1,13 @@
 /**
  * Common utilities for reMarkable API operations
  *
- * Usage: import { getDeviceToken, initApi, findDocument } from "./common.js"
+ * Usage: import { getDeviceToken, initApi, findDocument, listItemsCached } from "./common.js"
  */
 
 import { remarkable, type RemarkableApi, type Entry } from "rmapi-js";
 import { execFileSync } from "child_process";
+import { readFile, writeFile, mkdir, rename } from "fs/promises";
+import { dirname, join } from "path";
 
 // 1Password item name for Remarkable API credentials
 // Override with OP_REMARKABLE_ITEM env var if you have naming conflicts
@@ -13,10 +15,16 @@ const OP_ITEM_NAME = process.env.OP_REMARKABLE_ITEM || "Remarkable";
 
 /**
  * Retrieve device token from 1Password
+ *
+ * REMARKABLE_DEVICE_TOKEN takes precedence, so a caller that already
+ * fetched the token (e.g. rm_client.py starting serve.ts) can pass it on.
  * @returns Device token string
  * @throws Error if 1Password item not found
  */
 export async function getDeviceToken(): Promise<string> {
+  if (process.env.REMARKABLE_DEVICE_TOKEN) {
+    return process.env.REMARKABLE_DEVICE_TOKEN;
+  }
   try {
     const result = execFileSync("op", ["item", "get", OP_ITEM_NAME, "--fields", "device_token", "--reveal"], {
       encoding: "utf-8",
@@ -68,6 +76,107 @@ export async function initApi(): Promise<RemarkableApi> {
   return remarkable(deviceToken);
 }
 
+/** Listing cache file, relative to the skill directory like data/downloads */
+export const LISTING_CACHE = join("data", "cache", "listing.json");
+
+interface ListingCache {
+  rootHash: string;
+  /** Items keyed by their own hash, so an unchanged hash is an unchanged item */
+  items: Record<string, Entry>;
+}
+
+/**
+ * Run fn over items with at most `limit` calls in flight, keeping order
+ * @param items - Inputs
+ * @param limit - Maximum concurrent calls
+ * @param fn - Async function to apply
+ * @returns Results in input order
+ */
+export async function mapConcurrent<T, R>(
+  items: T[],
+  limit: number,
+  fn: (item: T, index: number) => Promise<R>
+): Promise<R[]> {
+  const results: R[] = new Array(items.length);
+  let next = 0;
+  const workers = Array.from({ length: Math.min(Math.max(1, limit), items.length) }, async () => {
+    while (next < items.length) {
+      const index = next++;
+      results[index] = await fn(items[index], index);
+    }
+  });
+  await Promise.all(workers);
+  return results;
+}
+
+/**
+ * List all items, reusing a local cache validated against the cloud hash tree
+ *
+ * The sync API stores the library as a Merkle tree: the root hash lists one
+ * hash per item, and an item's hash changes whenever any of its files do.
+ * If the root hash matches the cache, the cached listing is returned after a
+ * single request. Otherwise only items whose hash changed are fetched
+ * (their file list and .metadata); everything else comes from the cache.
+ * @param api - Initialized API
+ * @param refresh - Ignore the cache and fetch every item
+ * @returns Items like api.listItems(), with deleted items left out
+ */
+export async function listItemsCached(api: RemarkableApi, refresh = false): Promise<Entry[]> {
+  let cache: ListingCache = { rootHash: "", items: {} };
+  if (!refresh) {
+    try {
+      cache = JSON.parse(await readFile(LISTING_CACHE, "utf-8"));
+    } catch {
+      // No cache yet (or unreadable): fetch everything
+    }
+  }
+
+  const [rootHash] = await api.raw.getRootHash();
+  if (cache.rootHash === rootHash) {
+    return Object.values(cache.items);
+  }
+
+  const { entries } = await api.raw.getEntries(rootHash);
+  const fetched = await mapConcurrent(entries, 8, async (entry): Promise<Entry | null> => {
+    const cached = cache.items[entry.hash];
+    if (cached) return cached;
+
+    const files = (await api.raw.getEntries(entry.hash)).entries;
+    const metadataFile = files.find((f) => f.id.endsWith(".metadata"));
+    if (!metadataFile) return null;
+    const metadata = await api.raw.getMetadata(metadataFile.hash);
+    if (metadata.deleted) return null;
+
+    const item = {
+      id: entry.id,
+      hash: entry.hash,
+      visibleName: metadata.visibleName,
+      lastModified: metadata.lastModified,
+      parent: metadata.parent,
+      pinned: metadata.pinned,
+      type: metadata.type,
+    } as Entry;
+    if (metadata.type === "DocumentType") {
+      const ext = files.map((f) => f.id.split(".").pop()).find((e) => e === "pdf" || e === "epub");
+      Object.assign(item, { fileType: ext ?? "notebook", lastOpened: metadata.lastOpened ?? "" });
+    }
+    return item;
+  });
+
+  const items: Record<string, Entry> = {};
+  for (const item of fetched) {
+    if (item) items[item.hash] = item;
+  }
+
+  // Write atomically so a concurrent reader never sees a partial file
+  await mkdir(dirname(LISTING_CACHE), { recursive: true });
+  const tmpPath = `${LISTING_CACHE}.${process.pid}.tmp`;
+  await writeFile(tmpPath, JSON.stringify({ rootHash, items }));
+  await rename(tmpPath, LISTING_CACHE);
+
+  return Object.values(items);
+}
+
 /**
  * Fuzzy search for documents by name
  * @param items - List of entries from api.listItems()
@@ -9,7 +9,7 @@
  *   npx tsx download.ts --hash abc123def456        # Download by hash
  */
 
-import { initApi, findDocuments, safeName, today } from "./common.js";
+import { initApi, listItemsCached, findDocuments, safeName, today } from "./common.js";
 import { writeFile, mkdir } from "fs/promises";
 import { join } from "path";
 
@@ -73,7 +73,7 @@ async function main() {
       // Use hash as name if metadata lookup fails
     }
   } else {
-    const items = await api.listItems();
+    const items = await listItemsCached(api);
     const matches = findDocuments(items, options.query!);
 
     if (matches.length === 0) {
@@ -143,9 +143,8 @@ async function main() {
   }
 
   console.log(`\nDownload complete. Files saved to: ${outputDir}`);
-  console.log("\nTo render annotations, extract the ZIP and run:");
-  console.log(`  unzip "${join(outputDir, safeDocName + ".zip")}" -d "${join(outputDir, safeDocName + "_extracted")}"`);
-  console.log(`  python skills/remarkable/assets/scripts/render-annotations.py "${join(outputDir, safeDocName + "_extracted")}" "${join(outputDir, safeDocName + "-annotated.pdf")}"`);
+  console.log("\nTo render annotations, run:");
+  console.log(`  python skills/remarkable/assets/scripts/render-annotations.py "${join(outputDir, safeDocName + ".zip")}" "${join(outputDir, safeDocName + "-annotated.pdf")}"`);
 }
 
 main().catch((error) => {
@@ -5,11 +5,11 @@
  * Usage:
  *   npx tsx list.ts              # List all documents
  *   npx tsx list.ts --search "query"  # Search by name
- *   npx tsx list.ts --refresh    # Force refresh from cloud
+ *   npx tsx list.ts --refresh    # Ignore the listing cache and refetch everything
  *   npx tsx list.ts --json       # Output as JSON
  */
 
-import { initApi, findDocuments, getFolders, getPath, safeName } from "./common.js";
+import { initApi, listItemsCached, findDocuments, getFolders, getPath, safeName } from "./common.js";
 import type { Entry } from "rmapi-js";
 
 interface ListOptions {
@@ -39,7 +39,7 @@ async function main() {
   const options = parseArgs();
 
   const api = await initApi();
-  const items = await api.listItems(options.refresh);
+  const items = await listItemsCached(api, options.refresh);
 
   // Filter to documents only for search
   let documents: Entry[];
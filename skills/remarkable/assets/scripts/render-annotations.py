@@ -2,32 +2,51 @@
 """
 Render reMarkable annotations onto PDF pages.
 
-This script takes an extracted reMarkable document archive and overlays
-the handwritten annotations (.rm files) onto the original PDF.
+This script takes a reMarkable document archive (the ZIP itself or an
+extracted copy) and overlays the handwritten annotations (.rm files)
+onto the original PDF.
 
 Usage:
-    python render-annotations.py <extracted_dir> <output.pdf>
+    python render-annotations.py <document.zip|extracted_dir> <output.pdf> [--jobs N]
 
 Example:
-    unzip Document.zip -d Document_extracted
-    python render-annotations.py Document_extracted Document-annotated.pdf
+    python render-annotations.py Document.zip Document-annotated.pdf
+
+    # Parse pages across 8 worker processes (output is identical to --jobs 1)
+    python render-annotations.py Document.zip Document-annotated.pdf --jobs 8
+
+    # Drop pen samples that deviate less than 0.1pt from the simplified path
+    python render-annotations.py Document.zip Document-annotated.pdf --simplify 0.1
+
+    # Render every document of a backup.ts backup, straight from its ZIPs
+    python render-annotations.py --bulk data/downloads/2026-01-25-backup --jobs 4
+
+Re-rendering to the same output only redraws pages whose .rm files changed.
+Page hashes are kept in <output.pdf>.render-cache.json; use --force to
+render every page from scratch.
 
 Requirements:
-    uv pip install rmscene PyMuPDF svgwrite
+    uv pip install rmscene PyMuPDF numpy
 
-The .rm file format (v6) is parsed using the rmscene library.
+The .rm file format (v6) is parsed by rm_strokes.py, which reads line
+blocks directly and falls back to the rmscene library for anything else.
 Strokes are rendered as vector paths and overlaid onto PDF pages.
 """
 
+import os
+import re
 import sys
+import time
 import json
-from pathlib import Path
-from dataclasses import dataclass
+import hashlib
+import zipfile
+import argparse
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path, PurePosixPath
 from typing import Optional
 
 try:
-    from rmscene import read_blocks
-    from rmscene.scene_items import Line
+    import rmscene  # noqa: F401 - parsed via rm_strokes
 except ImportError:
     print("Error: rmscene not installed. Run: uv pip install rmscene")
     sys.exit(1)
@@ -38,6 +57,15 @@ except ImportError:
     print("Error: PyMuPDF not installed. Run: uv pip install PyMuPDF")
     sys.exit(1)
 
+try:
+    import numpy as np
+except ImportError:
+    print("Error: numpy not installed. Run: uv pip install numpy")
+    sys.exit(1)
+
+from rm_archive import Document, open_document
+from rm_strokes import PageStrokes, Stroke, extract_strokes, extract_strokes_from_bytes
+
 
 # reMarkable display dimensions (pixels)
 RM_WIDTH = 1404
@@ -51,6 +79,35 @@ COLOR_MAP = {
     2: (1, 1, 1),        # White (for eraser)
 }
 
+# Bump when rendering output changes so cached pages are redrawn
+RENDER_CACHE_VERSION = 3
+
+# Pens whose nib responds to pressure and tilt on the device: brushes,
+# pencils, ballpoints, mechanical pencils and calligraphy pen
+VARIABLE_WIDTH_PENS = {0, 12, 1, 14, 2, 15, 7, 13, 21}
+
+# Outline polygons are simplified to this deviation (PDF points) before
+# drawing; a filled outline has twice the vertices of its centreline
+OUTLINE_TOLERANCE = 0.05
+
+# Samples averaged when deriving outline widths from pressure and tilt
+WIDTH_SMOOTHING = 5
+
+# Erasers: 6 rubs out what its tip passes over, 8 clears a lasso area
+ERASER_PEN = 6
+ERASE_AREA_PEN = 8
+ERASER_PENS = {ERASER_PEN, ERASE_AREA_PEN}
+
+# Highlighters share one translucent, multiplied layer per page
+HIGHLIGHTER_PENS = {5, 18}
+HIGHLIGHT_OPACITY = 0.4
+HIGHLIGHT_GSTATE = "RMHighlight"
+
+# Cell size (reMarkable pixels) of the spatial grid used to find ink
+# under an eraser, and eraser segments tested per grid query
+ERASER_GRID_CELL = 16
+ERASER_PIECE = 8
+
 # Pen types
 PEN_TYPES = {
     0: "brush",
@@ -59,57 +116,246 @@ PEN_TYPES = {
     5: "highlighter",
     6: "eraser",
     7: "mechanical_pencil",
+    8: "erase_area",
+    18: "highlighter",
     21: "calligraphy",
 }
 
 
-@dataclass
-class Stroke:
-    """A single stroke from the .rm file."""
-    points: list[tuple[float, float, float]]  # (x, y, pressure)
-    color: int
-    thickness: float
-    pen_type: int
+def simplify_strokes(strokes: PageStrokes, tolerance: float) -> PageStrokes:
+    """
+    Simplify every stroke on a page with Ramer-Douglas-Peucker.
 
+    All strokes are processed together, one recursion level at a time: each
+    pass measures the distance of every interior point to its current
+    segment with numpy, then splits every segment whose farthest point lies
+    beyond tolerance. Stroke endpoints are always kept.
 
-def extract_strokes(rm_path: Path) -> list[Stroke]:
-    """
-    Extract strokes from a .rm file.
+    Args:
+        strokes: Page strokes to simplify
+        tolerance: Maximum deviation, in the same units as strokes.points
 
-    The rmscene library parses the v6 binary format which uses
-    a block-based structure with CRDT support.
+    Returns:
+        A new PageStrokes with the surviving points
     """
-    strokes = []
+    if len(strokes) == 0 or tolerance <= 0:
+        return strokes
+
+    xy = strokes.points[:, :2].astype(np.float64)
+    starts = strokes.offsets[:-1]
+    ends = strokes.offsets[1:] - 1  # inclusive last point of each stroke
+
+    keep = np.zeros(len(xy), dtype=bool)
+    keep[starts] = True
+    keep[ends] = True
+
+    seg_start, seg_end = starts, ends
+    while True:
+        # Only segments with interior points can be split
+        interior = seg_end - seg_start - 1
+        active = interior > 0
+        seg_start, seg_end, interior = seg_start[active], seg_end[active], interior[active]
+        if len(seg_start) == 0:
+            break
+
+        # Flat index of every interior point, grouped by segment
+        group_pos = np.cumsum(interior) - interior
+        idx = np.arange(interior.sum()) - np.repeat(group_pos, interior) + np.repeat(seg_start + 1, interior)
+        a = np.repeat(xy[seg_start], interior, axis=0)
+        b = np.repeat(xy[seg_end], interior, axis=0)
+
+        # Distance from each point to its segment (not the infinite line,
+        # so strokes that double back on themselves keep their turns)
+        ab = b - a
+        ap = xy[idx] - a
+        ab_len2 = np.einsum("ij,ij->i", ab, ab)
+        t = np.clip(np.einsum("ij,ij->i", ap, ab) / np.where(ab_len2 > 0, ab_len2, 1.0), 0.0, 1.0)
+        dist = np.hypot(*(ap - t[:, None] * ab).T)
+
+        # Farthest point per segment (first one on ties)
+        max_dist = np.maximum.reduceat(dist, group_pos)
+        at_max = np.flatnonzero(dist == np.repeat(max_dist, interior))
+        seg_of_max = np.searchsorted(group_pos, at_max, side="right") - 1
+        first = np.unique(seg_of_max, return_index=True)[1]
+        split_at = idx[at_max[first]]
+
+        split = max_dist > tolerance
+        if not split.any():
+            break
+        split_at = split_at[split]
+        keep[split_at] = True
+        seg_start, seg_end = (
+            np.concatenate([seg_start[split], split_at]),
+            np.concatenate([split_at, seg_end[split]]),
+        )
 
-    try:
-        with open(rm_path, "rb") as f:
-            for block in read_blocks(f):
-                # Look for Line objects which contain stroke data
-                if hasattr(block, "value") and isinstance(block.value, Line):
-                    line = block.value
-                    points = []
-
-                    for p in line.points:
-                        # Points have x, y, and various attributes
-                        x = getattr(p, "x", 0)
-                        y = getattr(p, "y", 0)
-                        pressure = getattr(p, "pressure", 0.5)
-                        points.append((x, y, pressure))
-
-                    if points:
-                        strokes.append(Stroke(
-                            points=points,
-                            color=getattr(line, "color", 0),
-                            thickness=getattr(line, "thickness_scale", 1.0),
-                            pen_type=getattr(line, "tool", 0),
-                        ))
-    except Exception as e:
-        print(f"Warning: Failed to parse {rm_path}: {e}")
+    kept_per_stroke = np.add.reduceat(keep, starts)
+    return PageStrokes(
+        points=strokes.points[keep],
+        offsets=np.concatenate([[0], np.cumsum(kept_per_stroke)]).astype(np.int64),
+        color=strokes.color,
+        thickness=strokes.thickness,
+        pen_type=strokes.pen_type,
+    )
 
-    return strokes
 
+class PointGrid:
+    """
+    Uniform-grid spatial index over points.
 
-def load_content_mapping(extracted_dir: Path) -> dict[str, int]:
+    Points are sorted by cell, column by column, so the cells of a query
+    box that share a grid column form one contiguous slice found with two
+    binary searches.
+    """
+
+    def __init__(self, xy: np.ndarray, cell: float = ERASER_GRID_CELL):
+        self.cell = cell
+        self.origin = xy.min(axis=0) if len(xy) else np.zeros(2)
+        cells = np.floor((xy - self.origin) / cell).astype(np.int64)
+        self.columns, self.rows = (cells.max(axis=0) + 1).tolist() if len(xy) else (0, 0)
+        keys = cells[:, 0] * self.rows + cells[:, 1]
+        self.order = np.argsort(keys, kind="stable")
+        self.keys = keys[self.order]
+
+    def query(self, box: np.ndarray) -> np.ndarray:
+        """Indices of the points in every cell that box (x0, y0, x1, y1) touches."""
+        lo_cell = np.floor((box[:2] - self.origin) / self.cell).astype(np.int64)
+        hi_cell = np.floor((box[2:] - self.origin) / self.cell).astype(np.int64)
+        cx0, cy0 = np.maximum(lo_cell, 0).tolist()
+        cx1, cy1 = np.minimum(hi_cell, [self.columns - 1, self.rows - 1]).tolist()
+        if cx0 > cx1 or cy0 > cy1:
+            return np.empty(0, dtype=np.int64)
+
+        columns = np.arange(cx0, cx1 + 1) * self.rows
+        lo = np.searchsorted(self.keys, columns + cy0, side="left")
+        hi = np.searchsorted(self.keys, columns + cy1, side="right")
+        n = hi - lo
+        return self.order[np.arange(n.sum()) - np.repeat(np.cumsum(n) - n, n) + np.repeat(lo, n)]
+
+
+def _point_chunks(n_points: int, n_edges: int, budget: int = 1 << 20):
+    """Slices over n_points keeping each points x edges block under budget."""
+    step = max(1, budget // max(n_edges, 1))
+    for start in range(0, n_points, step):
+        yield slice(start, start + step)
+
+
+def distance_to_polyline(points: np.ndarray, path: np.ndarray) -> np.ndarray:
+    """Distance from each point to the nearest segment of path."""
+    a = path[:-1] if len(path) > 1 else path
+    ab = (path[1:] if len(path) > 1 else path) - a
+    ab_len2 = np.einsum("ij,ij->i", ab, ab)
+    ab_len2 = np.where(ab_len2 > 0, ab_len2, 1.0)
+
+    dist = np.empty(len(points))
+    for chunk in _point_chunks(len(points), len(a)):
+        ap = points[chunk, None, :] - a[None, :, :]
+        t = np.clip(np.einsum("mkj,kj->mk", ap, ab) / ab_len2, 0.0, 1.0)
+        offset = ap - t[..., None] * ab[None, :, :]
+        dist[chunk] = np.sqrt(np.einsum("mkj,mkj->mk", offset, offset).min(axis=1))
+    return dist
+
+
+def inside_polygon(points: np.ndarray, polygon: np.ndarray) -> np.ndarray:
+    """Even-odd test of each point against a closed polygon."""
+    a = polygon
+    b = np.roll(polygon, -1, axis=0)
+    inside = np.zeros(len(points), dtype=bool)
+    for chunk in _point_chunks(len(points), len(a)):
+        x = points[chunk, 0, None]
+        y = points[chunk, 1, None]
+        crosses = (a[:, 1] > y) != (b[:, 1] > y)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            x_at_y = a[:, 0] + (y - a[:, 1]) * (b[:, 0] - a[:, 0]) / (b[:, 1] - a[:, 1])
+        inside[chunk] = np.count_nonzero(crosses & (x < x_at_y), axis=1) % 2 == 1
+    return inside
+
+
+def apply_erasers(strokes: PageStrokes, rm_per_point: float) -> PageStrokes:
+    """
+    Subtract eraser strokes from the strokes drawn before them.
+
+    Pen samples within an eraser's radius of its path (or inside an
+    erase-area lasso) are removed, and strokes are split where samples
+    were removed. Eraser paths are walked a few segments at a time and
+    each piece only tests the samples a PointGrid returns around it, so
+    the work follows how much ink lies under the eraser rather than the
+    number of strokes on the page. Eraser strokes are dropped from the
+    result.
+
+    Args:
+        strokes: Page strokes in drawing order, in reMarkable units
+        rm_per_point: Length of one PDF point in reMarkable units, used
+            for erasers without a per-point nib width
+
+    Returns:
+        A new PageStrokes without erasers, or strokes itself if the page
+        has none
+    """
+    pen = strokes.pen_type
+    is_eraser = np.isin(pen, list(ERASER_PENS))
+    if not is_eraser.any():
+        return strokes
+
+    xy = strokes.points[:, :2].astype(np.float64)
+    starts = strokes.offsets[:-1]
+    counts = np.diff(strokes.offsets)
+    stroke_of_point = np.repeat(np.arange(len(strokes)), counts)
+    alive = np.ones(len(xy), dtype=bool)
+
+    ink = np.flatnonzero(~is_eraser[stroke_of_point])
+    grid = PointGrid(xy[ink])
+
+    for e in np.flatnonzero(is_eraser & (counts > 0)):
+        path = xy[starts[e]:starts[e] + counts[e]]
+        if pen[e] == ERASE_AREA_PEN:
+            # A lasso only makes sense as a whole polygon
+            radius = 0.0
+            pieces = [path]
+        else:
+            # Device nib width is stored in quarter pixels
+            nib = float(np.median(strokes.points[starts[e]:starts[e] + counts[e], 3]))
+            radius = max(nib / 8, stroke_style(strokes[e])[1] / 2 * rm_per_point)
+            pieces = [path[i:i + ERASER_PIECE + 1]
+                      for i in range(0, max(len(path) - 1, 1), ERASER_PIECE)]
+
+        for piece in pieces:
+            box = np.concatenate([piece.min(axis=0) - radius, piece.max(axis=0) + radius])
+            idx = ink[grid.query(box)]
+            # Erasers only affect earlier ink that is still there
+            idx = idx[(stroke_of_point[idx] < e) & alive[idx]]
+            p = xy[idx]
+            inside = (p[:, 0] >= box[0]) & (p[:, 0] <= box[2]) & (p[:, 1] >= box[1]) & (p[:, 1] <= box[3])
+            idx, p = idx[inside], p[inside]
+            if not len(idx):
+                continue
+
+            if pen[e] == ERASE_AREA_PEN:
+                hit = inside_polygon(p, piece)
+            else:
+                hit = distance_to_polyline(p, piece) <= radius
+            alive[idx[hit]] = False
+
+    # Split what is left into runs of consecutive surviving samples
+    keep = alive & ~is_eraser[stroke_of_point]
+    stroke_start = np.zeros(len(xy), dtype=bool)
+    stroke_start[starts[counts > 0]] = True
+    previous_kept = np.zeros_like(keep)
+    previous_kept[1:] = keep[:-1]
+    run_start = keep & (stroke_start | ~previous_kept)
+    run_stroke = stroke_of_point[run_start]
+    run_lengths = np.bincount(np.cumsum(run_start)[keep] - 1, minlength=len(run_stroke))
+
+    return PageStrokes(
+        points=strokes.points[keep],
+        offsets=np.concatenate([[0], np.cumsum(run_lengths)]).astype(np.int64),
+        color=strokes.color[run_stroke],
+        thickness=strokes.thickness[run_stroke],
+        pen_type=pen[run_stroke],
+    )
+
+
+def load_content_mapping(document: Document) -> dict[str, int]:
     """
     Load page UUID to page number mapping from .content file.
 
@@ -117,14 +363,9 @@ def load_content_mapping(extracted_dir: Path) -> dict[str, int]:
     to their position in the PDF.
     """
     mapping = {}
-
-    content_files = list(extracted_dir.glob("*.content"))
-    if not content_files:
-        return mapping
+    content = document.content
 
     try:
-        content = json.loads(content_files[0].read_text())
-
         # Handle different content file formats
         if "cPages" in content and "pages" in content["cPages"]:
             # Newer format with cPages structure
@@ -138,63 +379,285 @@ def load_content_mapping(extracted_dir: Path) -> dict[str, int]:
                 if page_id:
                     mapping[page_id] = i
 
-    except (json.JSONDecodeError, KeyError) as e:
+    except (KeyError, TypeError, AttributeError) as e:
         print(f"Warning: Failed to parse content file: {e}")
 
     return mapping
 
 
-def find_original_pdf(extracted_dir: Path) -> Optional[Path]:
-    """Find the original PDF in the extracted archive."""
-    pdf_files = list(extracted_dir.glob("*.pdf"))
-    if pdf_files:
-        return pdf_files[0]
-    return None
+def open_original_pdf(document: Document) -> Optional[fitz.Document]:
+    """
+    Open the document's original PDF, or return None for notebooks.
+
+    Extracted PDFs are opened from disk; zipped ones from memory.
+    """
+    name = document.pdf_name
+    if name is None:
+        return None
+    path = document.local_path(name)
+    if path is not None:
+        return fitz.open(path)
+    return fitz.open(stream=document.read(name), filetype="pdf")
+
 
+# PDF content-stream tokens that are operands rather than operators:
+# strings, hex strings, names, numbers, arrays and dictionary delimiters
+_CONTENT_OPERAND = re.compile(
+    rb"\((?:\\.|[^\\)])*\)|<<|>>|<[0-9A-Fa-f\s]*>|/[^\s/\[\]()<>{}]*|[+-]?(?:\d+\.?\d*|\.\d+)|[\[\]{}]"
+)
 
-def render_strokes_to_page(page: fitz.Page, strokes: list[Stroke]) -> None:
-    """Render strokes onto a PDF page."""
+
+def count_content_operators(page: fitz.Page) -> int:
+    """Count drawing operators (m, l, S, q, Q, ...) in a page's content streams."""
+    content = _CONTENT_OPERAND.sub(b" ", page.read_contents())
+    return len(content.split())
+
+
+def stroke_style(stroke: Stroke) -> tuple[tuple[float, float, float], float]:
+    """Return the (color, width) a stroke is drawn with."""
+    # Get color
+    color = COLOR_MAP.get(stroke.color, (0, 0, 0))
+
+    # Base stroke width; variable-width pens are modulated around it
+    width = max(0.5, stroke.thickness * 1.5)
+
+    # Highlighters are yellow; transparency comes from their page layer
+    if stroke.pen_type in HIGHLIGHTER_PENS:
+        color = (1, 1, 0)  # Yellow
+
+    return color, width
+
+
+def page_scale(page: fitz.Page) -> tuple[float, float]:
+    """Scale factors from reMarkable coordinates to PDF points for a page."""
     rect = page.rect
+    return rect.width / RM_WIDTH, rect.height / RM_HEIGHT
+
+
+def stroke_half_widths(stroke: Stroke, base_width: float) -> np.ndarray:
+    """
+    Per-point half widths (PDF points) from pressure and nib width.
+
+    Pressure (0-255) scales the base width from 0.4x to 1.6x. The device's
+    per-point width, which grows when a pencil is tilted, scales it again
+    relative to the stroke's median width. Sensor noise is smoothed with
+    a short moving average so outlines stay clean and simplify well.
+    """
+    pressure = stroke.points[:, 2].astype(np.float64)
+    nib = stroke.points[:, 3].astype(np.float64)
+    factor = 0.4 + 1.2 * np.clip(pressure / 255.0, 0.0, 1.0)
+    median_nib = np.median(nib)
+    if median_nib > 0:
+        factor *= np.clip(nib / median_nib, 0.5, 2.0)
+    if len(factor) > WIDTH_SMOOTHING:
+        padded = np.pad(factor, WIDTH_SMOOTHING // 2, mode="edge")
+        factor = np.convolve(padded, np.full(WIDTH_SMOOTHING, 1.0 / WIDTH_SMOOTHING), mode="valid")
+    return 0.5 * base_width * factor
+
+
+def stroke_outline(xy: np.ndarray, half_width: np.ndarray) -> np.ndarray:
+    """
+    Build a closed polygon around a polyline with per-point half widths.
+
+    Each point is offset along the normal of the direction between its
+    neighbours: the left side runs forward and the right side backward.
+    Repeated samples borrow the direction of the nearest moving point.
+    """
+    xy = xy.astype(np.float64)
+    tangent = np.empty_like(xy)
+    tangent[1:-1] = xy[2:] - xy[:-2]
+    tangent[0] = xy[1] - xy[0]
+    tangent[-1] = xy[-1] - xy[-2]
+    length = np.hypot(tangent[:, 0], tangent[:, 1])
+
+    moving = length > 0
+    if not moving.any():
+        tangent[:] = (1.0, 0.0)
+        length[:] = 1.0
+    elif not moving.all():
+        # Forward-fill directions, then back-fill any leading gap
+        idx = np.where(moving, np.arange(len(xy)), 0)
+        np.maximum.accumulate(idx, out=idx)
+        idx[:np.argmax(moving)] = np.argmax(moving)
+        tangent, length = tangent[idx], length[idx]
+
+    normal = np.column_stack([-tangent[:, 1], tangent[:, 0]]) / length[:, None]
+    offset = normal * half_width[:, None]
+    return np.concatenate([xy + offset, (xy - offset)[::-1]])
+
+
+def append_path(shape: fitz.Shape, xy: np.ndarray, close: bool = False) -> None:
+    """
+    Append a polyline to a shape's drawing buffer in one formatting call.
+
+    Equivalent to shape.draw_polyline(), but transforms and formats all
+    points with numpy and a single %-format instead of building a
+    fitz.Point per vertex, and rounds to 0.01 pt.
+    """
+    m = shape.ipctm
+    xy = xy.astype(np.float64)
+    pdf = np.empty_like(xy)
+    pdf[:, 0] = xy[:, 0] * m.a + xy[:, 1] * m.c + m.e
+    pdf[:, 1] = xy[:, 0] * m.b + xy[:, 1] * m.d + m.f
+    # 1/100 pt is far below device resolution; shorter numbers keep the
+    # content stream (and the time spent deflating it) small
+    pdf = np.round(pdf, 2) + 0.0
+
+    ops = "%g %g m\n" + "%g %g l\n" * (len(pdf) - 1)
+    if close:
+        ops += "h\n"
+    shape.draw_cont += ops % tuple(pdf.ravel().tolist())
+
+
+def commit_uncompressed(shape: fitz.Shape) -> None:
+    """
+    Commit a shape's drawing commands as an uncompressed content stream.
+
+    Shape.commit() deflates every new stream at maximum compression, which
+    dominates render time on dense pages; the document is instead deflated
+    once, at the default level, when it is saved.
+    """
+    content = (shape.totalcont + shape.text_cont).encode()
+    shape.totalcont, shape.text_cont = " ", ""
+    shape.commit()
+    shape.doc.update_stream(shape.page.get_contents()[-1], content, compress=False)
+
+
+def add_ext_gstate(page: fitz.Page, name: str, definition: str) -> None:
+    """
+    Register a named graphics state in a page's /Resources.
+
+    Indirect /Resources and /ExtGState dictionaries are followed, since
+    xref_set_key cannot write through them.
+    """
+    doc = page.parent
+    xref, path = page.xref, ""
+    for key in ("Resources", "ExtGState"):
+        kind, value = doc.xref_get_key(xref, path + key)
+        if kind == "xref":
+            xref, path = int(value.split()[0]), ""
+        else:
+            if kind != "dict":
+                doc.xref_set_key(xref, path + key, "<<>>")
+            path += key + "/"
+    doc.xref_set_key(xref, path + name, definition)
+
+
+def render_strokes_to_page(
+    page: fitz.Page,
+    strokes: PageStrokes,
+    variable_width: bool = True,
+) -> int:
+    """
+    Render strokes onto a PDF page.
+
+    Strokes are grouped by (color, width, pen type) and drawn with one
+    Shape per page: one finish() per group and a single commit(), instead
+    of a new content stream per stroke.
 
+    Pressure-sensitive pens are drawn as filled outlines whose width
+    follows pen pressure and tilt; other pens (and all pens when
+    variable_width is False) are drawn as constant-width polylines.
+
+    Highlighters go first, in a single translucent layer blended with
+    Multiply, so they tint the page and ink beneath instead of hiding
+    it. Eraser strokes are not drawn; see apply_erasers().
+
+    Returns:
+        Number of style groups drawn
+    """
     # Calculate scale factors from reMarkable coordinates to PDF
-    scale_x = rect.width / RM_WIDTH
-    scale_y = rect.height / RM_HEIGHT
+    scale_x, scale_y = page_scale(page)
 
-    for stroke in strokes:
+    # Convert every point on the page to PDF coordinates at once
+    pdf_xy = strokes.scaled_xy(scale_x, scale_y)
+    offsets = strokes.offsets
+
+    # Group paths by style, keeping first-seen order for stable output.
+    # Outlines are left as None and filled in below.
+    groups: dict[tuple, list[Optional[np.ndarray]]] = {}
+    pending: list[tuple[list, int, np.ndarray]] = []
+
+    for i, stroke in enumerate(strokes):
         if len(stroke.points) < 2:
             continue
 
         # Skip eraser strokes (they should erase, not draw)
-        if stroke.pen_type == 6:
+        if stroke.pen_type in ERASER_PENS:
             continue
 
-        # Convert points to PDF coordinates
-        pdf_points = [
-            fitz.Point(p[0] * scale_x, p[1] * scale_y)
-            for p in stroke.points
-        ]
+        color, width = stroke_style(stroke)
+        xy = pdf_xy[offsets[i]:offsets[i + 1]]
 
-        # Get color
-        color = COLOR_MAP.get(stroke.color, (0, 0, 0))
-
-        # Calculate stroke width (pressure-sensitive would be complex)
-        width = max(0.5, stroke.thickness * 1.5)
-
-        # For highlighter, use transparency
-        if stroke.pen_type == 5:
-            color = (1, 1, 0)  # Yellow
-            # PyMuPDF doesn't support transparency easily, so we'll just use yellow
-
-        # Draw the stroke as a polyline
-        shape = page.new_shape()
-        shape.draw_polyline(pdf_points)
-        shape.finish(
-            color=color,
-            width=width,
-            lineCap=1,  # Round caps
-            lineJoin=1,  # Round joins
-        )
-        shape.commit()
+        outlined = variable_width and stroke.pen_type in VARIABLE_WIDTH_PENS
+        paths = groups.setdefault((color, width, stroke.pen_type, outlined), [])
+        if not outlined:
+            paths.append(xy)
+            continue
+
+        # The outline is also stroked at half the base width, which
+        # rounds its ends and keeps dots visible; shrink to match
+        half_width = np.maximum(stroke_half_widths(stroke, width) - width / 4, 0.0)
+        pending.append((paths, len(paths), stroke_outline(xy, half_width)))
+        paths.append(None)
+
+    if not groups:
+        return 0
+
+    if pending:
+        # Simplify every outline on the page in one vectorised pass
+        rings = [outline for *_, outline in pending]
+        lengths = np.array([len(ring) for ring in rings])
+        points = np.zeros((lengths.sum(), 4), dtype=np.float64)
+        points[:, :2] = np.concatenate(rings)
+        simplified = simplify_strokes(PageStrokes(
+            points=points,
+            offsets=np.concatenate([[0], np.cumsum(lengths)]).astype(np.int64),
+            color=np.zeros(len(rings), dtype=np.int16),
+            thickness=np.zeros(len(rings), dtype=np.float32),
+            pen_type=np.zeros(len(rings), dtype=np.int16),
+        ), OUTLINE_TOLERANCE)
+        for (paths, index, _), ring in zip(pending, simplified):
+            paths[index] = ring.points[:, :2]
+
+    # Draw every group into one shape and commit it once, uncompressed.
+    # Highlighter groups come first, wrapped in their blended layer.
+    highlight = [style for style in groups if style[2] in HIGHLIGHTER_PENS]
+    ink = [style for style in groups if style[2] not in HIGHLIGHTER_PENS]
+
+    shape = page.new_shape()
+    for n, style in enumerate(highlight + ink):
+        color, width, _pen_type, outlined = style
+        paths = groups[style]
+        for xy in paths:
+            append_path(shape, xy, close=outlined)
+        if outlined:
+            shape.finish(
+                color=color,
+                fill=color,
+                width=width / 2,
+                lineCap=1,  # Round caps
+                lineJoin=1,  # Round joins
+                closePath=False,  # Each outline is closed by append_path
+            )
+        else:
+            shape.finish(
+                color=color,
+                width=width,
+                lineCap=1,  # Round caps
+                lineJoin=1,  # Round joins
+                closePath=False,  # Strokes are open polylines
+            )
+        if n == len(highlight) - 1:
+            shape.totalcont = f"q\n/{HIGHLIGHT_GSTATE} gs\n{shape.totalcont}Q\n"
+
+    if highlight:
+        add_ext_gstate(page, HIGHLIGHT_GSTATE, (
+            f"<</Type/ExtGState/CA {HIGHLIGHT_OPACITY}/ca {HIGHLIGHT_OPACITY}/BM/Multiply>>"
+        ))
+    commit_uncompressed(shape)
+
+    return len(groups)
 
 
 def create_blank_notebook(num_pages: int, output_path: Path) -> fitz.Document:
@@ -211,94 +674,610 @@ def create_blank_notebook(num_pages: int, output_path: Path) -> fitz.Document:
     return doc
 
 
-def render_to_pdf(extracted_dir: Path, output_path: Path) -> None:
+def resolve_page_number(rm_file: PurePosixPath, page_mapping: dict[str, int]) -> int:
+    """Map a .rm file to its zero-based page number in the PDF."""
+    page_uuid = rm_file.stem
+
+    if page_uuid in page_mapping:
+        return page_mapping[page_uuid]
+
+    # Try to extract number from filename or use 0
+    try:
+        return int(page_uuid.split("-")[0])
+    except (ValueError, IndexError):
+        return 0
+
+
+def resolve_page_files(
+    rm_files: list[PurePosixPath], page_mapping: dict[str, int], page_count: int
+) -> list[tuple[int, PurePosixPath]]:
+    """Pair each .rm file with its page number, skipping pages the PDF lacks."""
+    page_files = []
+    for rm_file in rm_files:
+        page_num = resolve_page_number(rm_file, page_mapping)
+
+        # Skip if page doesn't exist
+        if page_num >= page_count:
+            print(f"Warning: Page {page_num} doesn't exist, skipping {rm_file.name}")
+            continue
+
+        page_files.append((page_num, rm_file))
+    return page_files
+
+
+def extract_page_strokes(document: Document, rm_file: PurePosixPath) -> PageStrokes:
+    """Extract one page's strokes, memory-mapping it when it is on disk."""
+    path = document.local_path(str(rm_file))
+    if path is not None:
+        return extract_strokes(path)
+    return extract_strokes_from_bytes(document.read(str(rm_file)))
+
+
+def _extract_page_job(job: tuple[Path, PurePosixPath]) -> PageStrokes:
+    """Worker entry point: open the document and parse one page."""
+    source, rm_file = job
+    with open_document(source) as document:
+        return extract_page_strokes(document, rm_file)
+
+
+def extract_all_strokes(
+    document: Document, rm_files: list[PurePosixPath], jobs: int = 1
+) -> list[PageStrokes]:
+    """
+    Extract strokes for every .rm file, preserving input order.
+
+    With jobs > 1 the parsing runs in a process pool. Results come back
+    in the same order as rm_files, so the single writer in render_to_pdf
+    draws them exactly as the serial path would.
+    """
+    if jobs <= 1 or len(rm_files) <= 1:
+        return [extract_page_strokes(document, rm_file) for rm_file in rm_files]
+
+    workers = min(jobs, len(rm_files))
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        # Small chunks keep workers busy when page sizes vary a lot
+        chunksize = max(1, len(rm_files) // (workers * 4))
+        job_list = [(document.path, rm_file) for rm_file in rm_files]
+        return list(pool.map(_extract_page_job, job_list, chunksize=chunksize))
+
+
+def member_sha256(document: Document, name: str) -> str:
+    """Return the SHA-256 hex digest of a document member."""
+    digest = hashlib.sha256()
+    with document.open(name) as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def page_content_keys(
+    document: Document, page_files: list[tuple[int, PurePosixPath]]
+) -> dict[str, str]:
+    """
+    Build a content key per page from the .rm files drawn onto it.
+
+    Keys are strings so they round-trip through the JSON cache file.
+    """
+    file_hashes: dict[str, list[str]] = {}
+    for page_num, rm_file in page_files:
+        file_hashes.setdefault(str(page_num), []).append(member_sha256(document, str(rm_file)))
+    return {
+        page: hashlib.sha256("".join(hashes).encode()).hexdigest()
+        for page, hashes in file_hashes.items()
+    }
+
+
+def render_cache_path(output_path: Path) -> Path:
+    """Sidecar file recording which page contents the output was rendered from."""
+    return output_path.with_name(output_path.name + ".render-cache.json")
+
+
+def load_render_cache(output_path: Path, settings: dict) -> Optional[dict[str, str]]:
+    """
+    Load cached page keys if the previous output can be reused.
+
+    Returns None when there is no previous render, it was made with
+    different settings or source, or the output changed since.
+    """
+    cache_path = render_cache_path(output_path)
+    if not cache_path.exists() or not output_path.exists():
+        return None
+
+    try:
+        cache = json.loads(cache_path.read_text())
+    except (json.JSONDecodeError, OSError):
+        return None
+
+    stat = output_path.stat()
+    if cache.get("settings") != settings:
+        return None
+    if cache.get("output") != [stat.st_size, stat.st_mtime_ns]:
+        return None
+
+    return cache.get("pages", {})
+
+
+def save_render_cache(output_path: Path, settings: dict, page_keys: dict[str, str]) -> None:
+    """Record the settings and page keys the output was rendered from."""
+    stat = output_path.stat()
+    render_cache_path(output_path).write_text(json.dumps({
+        "settings": settings,
+        "output": [stat.st_size, stat.st_mtime_ns],
+        "pages": page_keys,
+    }, indent=2))
+
+
+def reset_page(doc: fitz.Document, page_num: int, source: fitz.Document) -> None:
+    """
+    Restore a page of doc to the untouched page from source, in place.
+
+    The page object itself is kept, so outline entries and links that
+    point at it stay valid. Only its /Contents and /Resources are swapped
+    for copies of the source page's, grafted in through a temporary page.
+    """
+    doc.insert_pdf(source, from_page=page_num, to_page=page_num, links=False, annots=False)
+    scratch = doc.page_xref(len(doc) - 1)
+    target = doc.page_xref(page_num)
+    for key in ("Contents", "Resources"):
+        _, value = doc.xref_get_key(scratch, key)
+        doc.xref_set_key(target, key, value)
+    doc.delete_page(len(doc) - 1)
+
+
+def draw_annotations(
+    doc: fitz.Document,
+    page_strokes: list[tuple[int, PageStrokes]],
+    simplify: Optional[float] = None,
+    variable_width: bool = True,
+    verbose: bool = True,
+) -> dict[str, int]:
+    """
+    Composite, simplify and draw each page's strokes onto doc.
+
+    Returns:
+        Totals of strokes drawn, content operators and vertices before
+        and after
+    """
+    totals = dict.fromkeys(
+        ("strokes", "ops_before", "ops_after", "vertices_before", "vertices_after"), 0
+    )
+    log = print if verbose else (lambda *args, **kwargs: None)
+
+    for page_num, strokes in page_strokes:
+        if not strokes:
+            continue
+        page = doc[page_num]
+
+        # Cut erased ink out of earlier strokes before anything else
+        is_eraser = np.isin(strokes.pen_type, list(ERASER_PENS))
+        if is_eraser.any():
+            ink_before = len(strokes.points) - int(np.diff(strokes.offsets)[is_eraser].sum())
+            strokes = apply_erasers(strokes, 1 / max(page_scale(page)))
+            log(f"  Page {page_num + 1}: {int(is_eraser.sum())} eraser stroke(s) removed "
+                f"{ink_before - len(strokes.points)} of {ink_before} pen sample(s)")
+
+        if simplify:
+            # Convert the PDF-point tolerance into reMarkable units,
+            # using the larger axis scale so no deviation exceeds it
+            rm_tolerance = simplify / max(page_scale(page))
+            vertices_before = len(strokes.points)
+            strokes = simplify_strokes(strokes, rm_tolerance)
+            vertices_after = len(strokes.points)
+            totals["vertices_before"] += vertices_before
+            totals["vertices_after"] += vertices_after
+            log(f"  Page {page_num + 1}: vertices {vertices_before} -> {vertices_after}")
+
+        ops_before = count_content_operators(page)
+        groups = render_strokes_to_page(page, strokes, variable_width=variable_width)
+        ops_after = count_content_operators(page)
+        totals["strokes"] += len(strokes)
+        totals["ops_before"] += ops_before
+        totals["ops_after"] += ops_after
+        log(f"  Page {page_num + 1}: {len(strokes)} strokes in {groups} group(s), "
+            f"operators {ops_before} -> {ops_after}")
+
+    return totals
+
+
+def render_to_pdf(
+    source: Path,
+    output_path: Path,
+    jobs: int = 1,
+    simplify: Optional[float] = None,
+    force: bool = False,
+    variable_width: bool = True,
+) -> None:
     """
     Main rendering function.
 
+    source is a document ZIP or an extracted document directory; ZIP
+    members are read in place, without extracting them.
+
     1. Find original PDF (or create blank pages for notebooks)
     2. Load page mapping from .content file
-    3. Find all .rm files and extract strokes
-    4. Render strokes onto corresponding PDF pages
-    5. Save the result
+    3. Find all .rm files and extract strokes (in parallel if jobs > 1)
+    4. Reuse pages from the previous output whose .rm files are unchanged
+    5. Optionally simplify strokes to a tolerance in PDF points
+    6. Render strokes onto corresponding PDF pages, as pressure- and
+       tilt-aware outlines unless variable_width is False
+    7. Save the result and its page cache
     """
-    extracted_dir = Path(extracted_dir)
     output_path = Path(output_path)
 
-    # Find .rm files
-    rm_files = list(extracted_dir.rglob("*.rm"))
-    if not rm_files:
-        print("No .rm files found - document has no annotations")
-        # Just copy the original PDF if it exists
-        original = find_original_pdf(extracted_dir)
-        if original:
-            import shutil
-            shutil.copy(original, output_path)
-            print(f"Copied original PDF to: {output_path}")
-        return
+    with open_document(source) as document:
+        # Find .rm files
+        rm_files = document.rm_files
+        if not rm_files:
+            print("No .rm files found - document has no annotations")
+            # Just copy the original PDF if it exists
+            if document.pdf_name:
+                output_path.write_bytes(document.read(document.pdf_name))
+                print(f"Copied original PDF to: {output_path}")
+            return
+
+        print(f"Found {len(rm_files)} page(s) with annotations")
+
+        # Load page mapping
+        page_mapping = load_content_mapping(document)
+
+        # Open or create PDF
+        doc = open_original_pdf(document)
+        if doc is not None:
+            print(f"Original PDF: {PurePosixPath(document.pdf_name).name}")
+        else:
+            print("No original PDF - creating blank notebook pages")
+            doc = create_blank_notebook(len(rm_files), output_path)
+
+        # Resolve target pages up front so workers only parse pages we can draw on
+        page_files = resolve_page_files(rm_files, page_mapping, len(doc))
+
+        # Reuse the previous render when only some pages changed
+        settings = {
+            "version": RENDER_CACHE_VERSION,
+            "source": (member_sha256(document, document.pdf_name) if document.pdf_name
+                       else f"blank:{len(rm_files)}"),
+            "page_count": len(doc),
+            "simplify": simplify,
+            "variable_width": variable_width,
+        }
+        page_keys = page_content_keys(document, page_files)
+        cached_keys = None if force else load_render_cache(output_path, settings)
+        reusing = cached_keys is not None
+
+        if reusing:
+            dirty = {
+                page for page in set(cached_keys) | set(page_keys)
+                if cached_keys.get(page) != page_keys.get(page)
+            }
+            print(f"Reusing {len(doc) - len(dirty)} unchanged page(s) from {output_path.name}")
+
+            # Start from the previous output and restore changed pages from source
+            original = doc
+            doc = fitz.open(stream=output_path.read_bytes(), filetype="pdf")
+            for page in sorted(dirty, key=int):
+                reset_page(doc, int(page), original)
+            original.close()
+
+            page_files = [(page_num, rm_file) for page_num, rm_file in page_files
+                          if str(page_num) in dirty]
+
+        if jobs > 1:
+            print(f"Parsing {len(page_files)} page(s) with {jobs} worker(s)")
+
+        # Extract strokes, then render from a single writer in file order
+        all_strokes = extract_all_strokes(document, [rm_file for _, rm_file in page_files], jobs)
+
+    totals = draw_annotations(
+        doc,
+        [(page_num, strokes) for (page_num, _), strokes in zip(page_files, all_strokes)],
+        simplify=simplify,
+        variable_width=variable_width,
+    )
+
+    if totals["ops_after"]:
+        print(f"Page operators: {totals['ops_before']} -> {totals['ops_after']} "
+              f"(+{totals['ops_after'] - totals['ops_before']} for annotations)")
+    if totals["vertices_before"]:
+        print(f"Vertices: {totals['vertices_before']} -> {totals['vertices_after']} "
+              f"({totals['vertices_after'] / totals['vertices_before']:.0%} kept at {simplify}pt tolerance)")
+
+    # Save result. no_new_id keeps the trailer /ID stable, so repeated runs
+    # (and serial vs. --jobs runs) produce byte-identical files. Reused
+    # outputs are garbage-collected to drop the replaced page contents.
+    tmp_path = output_path.with_name(output_path.name + ".tmp")
+    doc.save(tmp_path, garbage=1 if reusing else 0, deflate=True, no_new_id=True)
+    doc.close()
+    os.replace(tmp_path, output_path)
+    save_render_cache(output_path, settings, page_keys)
+    print(f"\nRendered PDF saved to: {output_path}")
 
-    print(f"Found {len(rm_files)} page(s) with annotations")
 
-    # Load page mapping
-    page_mapping = load_content_mapping(extracted_dir)
+def render_archive(
+    zip_path: Path,
+    output_path: Path,
+    simplify: Optional[float] = None,
+    variable_width: bool = True,
+) -> dict:
+    """
+    Render one document ZIP from a backup without extracting it.
 
-    # Open or create PDF
-    original = find_original_pdf(extracted_dir)
-    if original:
-        print(f"Original PDF: {original.name}")
-        doc = fitz.open(original)
+    Returns a summary of pages, strokes and timings.
+    """
+    started = time.perf_counter()
+    with open_document(zip_path) as document:
+        rm_files = document.rm_files
+        if not document.pdf_name and not rm_files:
+            raise ValueError("nothing to render (no PDF or .rm pages)")
+
+        doc = open_original_pdf(document) or create_blank_notebook(len(rm_files), output_path)
+        page_files = resolve_page_files(rm_files, load_content_mapping(document), len(doc))
+        page_strokes = [
+            (page_num, extract_page_strokes(document, rm_file))
+            for page_num, rm_file in page_files
+        ]
+    parsed = time.perf_counter()
+
+    totals = draw_annotations(doc, page_strokes, simplify=simplify,
+                              variable_width=variable_width, verbose=False)
+    rendered = time.perf_counter()
+
+    tmp_path = output_path.with_name(output_path.name + ".tmp")
+    doc.save(tmp_path, deflate=True, no_new_id=True)
+    page_count = len(doc)
+    doc.close()
+    os.replace(tmp_path, output_path)
+    finished = time.perf_counter()
+
+    return {
+        "pages": page_count,
+        "annotated_pages": len(page_files),
+        "strokes": totals["strokes"],
+        "parse_s": round(parsed - started, 3),
+        "render_s": round(rendered - parsed, 3),
+        "save_s": round(finished - rendered, 3),
+        "total_s": round(finished - started, 3),
+        "output": output_path.name,
+        "size": output_path.stat().st_size,
+    }
+
+
+def _render_archive_job(job: tuple) -> dict:
+    """Worker entry point for bulk_export; never raises."""
+    entry, zip_path, output_path, simplify, variable_width = job
+    try:
+        return {**entry, **render_archive(zip_path, output_path, simplify, variable_width)}
+    except Exception as e:
+        return {**entry, "error": f"{type(e).__name__}: {e}"}
+
+
+def safe_name(name: str) -> str:
+    """Sanitize a document name for the filesystem, like safeName() in common.ts."""
+    return re.sub(r"\s+", "_", re.sub(r"[^a-zA-Z0-9-_. ]", "_", name))
+
+
+def backup_documents(source: Path) -> tuple[Path, list[dict]]:
+    """
+    List the document ZIPs of a backup made by backup.ts.
+
+    source is the backup directory or its manifest.json. Without a
+    manifest, every *.zip in the directory is used. Manifest entries
+    whose download failed are skipped.
+
+    Snapshots of the content-addressed store point at blobs named by
+    document hash; their outputs are named "<name>-<hash8>" like the
+    files of older backups.
+
+    Returns:
+        The backup directory and one {"name", "file", "stem"} entry per document
+    """
+    manifest_path = source if source.is_file() else source / "manifest.json"
+    backup_dir = manifest_path.parent
+
+    if manifest_path.exists():
+        manifest = json.loads(manifest_path.read_text())
+        entries = []
+        for doc in manifest.get("documents", []):
+            if not doc.get("file") or doc.get("error"):
+                continue
+            name = doc.get("name", doc["file"])
+            stem = Path(doc["file"]).stem
+            if stem == doc.get("hash"):
+                stem = f"{safe_name(name)}-{stem[:8]}"
+            entries.append({"name": name, "file": doc["file"], "stem": stem})
     else:
-        print("No original PDF - creating blank notebook pages")
-        doc = create_blank_notebook(len(rm_files), output_path)
+        entries = [{"name": zip_path.stem, "file": zip_path.name, "stem": zip_path.stem}
+                   for zip_path in sorted(backup_dir.glob("*.zip"))]
 
-    # Process each .rm file
-    for rm_file in rm_files:
-        page_uuid = rm_file.stem
+    return backup_dir, entries
 
-        # Determine page number
-        if page_uuid in page_mapping:
-            page_num = page_mapping[page_uuid]
-        else:
-            # Try to extract number from filename or use 0
-            try:
-                page_num = int(page_uuid.split("-")[0])
-            except (ValueError, IndexError):
-                page_num = 0
 
-        # Skip if page doesn't exist
-        if page_num >= len(doc):
-            print(f"Warning: Page {page_num} doesn't exist, skipping {rm_file.name}")
-            continue
+def bulk_export(
+    source: Path,
+    output_dir: Optional[Path] = None,
+    jobs: int = 1,
+    simplify: Optional[float] = None,
+    variable_width: bool = True,
+) -> list[dict]:
+    """
+    Render every document of a backup into annotated PDFs.
 
-        # Extract and render strokes
-        strokes = extract_strokes(rm_file)
-        if strokes:
-            print(f"  Page {page_num + 1}: {len(strokes)} strokes")
-            page = doc[page_num]
-            render_strokes_to_page(page, strokes)
+    Documents are rendered in a process pool, one document per task, so
+    interpreter and PyMuPDF start-up is paid once per worker instead of
+    once per document. A per-document summary is written to
+    <output_dir>/summary.json.
+    """
+    backup_dir, entries = backup_documents(source)
+    output_dir = output_dir or backup_dir / "annotated"
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    jobs_list = [
+        (entry, backup_dir / entry["file"],
+         output_dir / f"{entry['stem']}-annotated.pdf", simplify, variable_width)
+        for entry in entries
+    ]
+    print(f"Rendering {len(jobs_list)} document(s) from {backup_dir} with {jobs} worker(s)\n")
+
+    results: dict[str, dict] = {}
+
+    def report(result: dict) -> None:
+        results[result["file"]] = result
+        progress = f"[{len(results)}/{len(jobs_list)}]"
+        if "error" in result:
+            print(f"{progress} {result['name']}: FAILED - {result['error']}")
+        else:
+            print(f"{progress} {result['name']}: {result['annotated_pages']}/{result['pages']} "
+                  f"page(s), {result['strokes']} strokes in {result['total_s']:.2f}s")
 
-    # Save result
-    doc.save(output_path)
-    doc.close()
-    print(f"\nRendered PDF saved to: {output_path}")
+    started = time.perf_counter()
+    if jobs <= 1 or len(jobs_list) <= 1:
+        for job in jobs_list:
+            report(_render_archive_job(job))
+    else:
+        with ProcessPoolExecutor(max_workers=min(jobs, len(jobs_list))) as pool:
+            futures = [pool.submit(_render_archive_job, job) for job in jobs_list]
+            for future in as_completed(futures):
+                report(future.result())
+    elapsed = time.perf_counter() - started
+
+    # Keep the summary in manifest order regardless of completion order
+    summary = [results[entry["file"]] for entry in entries]
+    failed = [r for r in summary if "error" in r]
+    (output_dir / "summary.json").write_text(json.dumps({
+        "source": str(backup_dir),
+        "documents": len(summary),
+        "failed": len(failed),
+        "pages": sum(r.get("pages", 0) for r in summary),
+        "strokes": sum(r.get("strokes", 0) for r in summary),
+        "elapsed_s": round(elapsed, 3),
+        "results": summary,
+    }, indent=2))
+
+    print(f"\nRendered {len(summary) - len(failed)}/{len(summary)} document(s) in {elapsed:.1f}s")
+    print(f"Summary: {output_dir / 'summary.json'}")
+    return summary
+
+
+def benchmark_rendering(source: Path, repeat: int = 3) -> None:
+    """
+    Time constant-width polylines against variable-width outlines.
+
+    Strokes are parsed once; each mode then draws every page onto a fresh
+    in-memory copy of the source PDF and serializes it, as a save would.
+    Nothing is written to disk.
+    """
+    with open_document(source) as document:
+        rm_files = document.rm_files
+        if not rm_files:
+            print("No .rm files found - nothing to benchmark")
+            return
+
+        source_pdf = open_original_pdf(document) or create_blank_notebook(len(rm_files), None)
+        page_files = resolve_page_files(rm_files, load_content_mapping(document), len(source_pdf))
+        all_strokes = [extract_page_strokes(document, rm_file) for _, rm_file in page_files]
+    strokes_total = sum(len(strokes) for strokes in all_strokes)
+    print(f"Benchmarking {len(page_files)} page(s), {strokes_total} strokes, best of {repeat}\n")
+
+    start = time.perf_counter()
+    all_strokes = [apply_erasers(strokes, 1 / max(page_scale(source_pdf[page_num])))
+                   for (page_num, _), strokes in zip(page_files, all_strokes)]
+    elapsed = time.perf_counter() - start
+    print(f"  {'eraser compositing':<28} {elapsed * 1000:8.1f} ms  "
+          f"{strokes_total / elapsed:10.0f} strokes/s")
+
+    modes = [
+        ("polyline (constant width)", {"variable_width": False}),
+        ("outline (variable width)", {"variable_width": True}),
+    ]
+    for name, options in modes:
+        best = float("inf")
+        size = 0
+        for _ in range(max(1, repeat)):
+            doc = fitz.open()
+            doc.insert_pdf(source_pdf)
+            start = time.perf_counter()
+            for (page_num, _), strokes in zip(page_files, all_strokes):
+                render_strokes_to_page(doc[page_num], strokes, **options)
+            size = len(doc.tobytes(deflate=True, no_new_id=True))
+            best = min(best, time.perf_counter() - start)
+            doc.close()
+        print(f"  {name:<28} {best * 1000:8.1f} ms  "
+              f"{strokes_total / best:10.0f} strokes/s  {size / 1e6:6.2f} MB")
+
+    source_pdf.close()
 
 
 def main():
-    if len(sys.argv) != 3:
-        print("Usage: python render-annotations.py <extracted_dir> <output.pdf>")
-        print("")
-        print("Example:")
-        print("  unzip Document.zip -d Document_extracted")
-        print("  python render-annotations.py Document_extracted Document-annotated.pdf")
+    parser = argparse.ArgumentParser(
+        description="Render reMarkable annotations onto PDF pages",
+        epilog="Example:\n"
+               "  python render-annotations.py Document.zip Document-annotated.pdf\n"
+               "  python render-annotations.py --bulk data/downloads/2026-01-25-backup --jobs 4",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument("source", type=Path,
+                        help="reMarkable document ZIP or extracted directory "
+                             "(with --bulk: backup directory or its manifest.json)")
+    parser.add_argument("output_path", type=Path, nargs="?",
+                        help="Output PDF path (with --bulk: output directory, "
+                             "default <backup>/annotated)")
+    parser.add_argument("--jobs", "-j", type=int, default=1, metavar="N",
+                        help="Parse .rm pages across N worker processes (default: 1)")
+    parser.add_argument("--simplify", type=float, default=None, metavar="TOL",
+                        help="Simplify strokes to TOL PDF points of deviation (e.g. 0.1)")
+    parser.add_argument("--force", action="store_true",
+                        help="Render every page, ignoring the previous output's page cache")
+    parser.add_argument("--constant-width", action="store_true",
+                        help="Draw every stroke as a constant-width polyline")
+    parser.add_argument("--benchmark", action="store_true",
+                        help="Time polyline vs. variable-width rendering instead of writing a PDF")
+    parser.add_argument("--bulk", action="store_true",
+                        help="Render every document ZIP of a backup.ts backup, "
+                             "using --jobs worker processes")
+    args = parser.parse_args()
+
+    if args.jobs < 1:
+        print("Error: --jobs must be at least 1")
+        sys.exit(1)
+
+    if args.simplify is not None and args.simplify <= 0:
+        print("Error: --simplify tolerance must be positive")
         sys.exit(1)
 
-    extracted_dir = Path(sys.argv[1])
-    output_path = Path(sys.argv[2])
+    if args.bulk:
+        if not args.source.exists():
+            print(f"Error: Backup not found: {args.source}")
+            sys.exit(1)
+        bulk_export(
+            args.source,
+            args.output_path,
+            jobs=args.jobs,
+            simplify=args.simplify,
+            variable_width=not args.constant_width,
+        )
+        return
 
-    if not extracted_dir.is_dir():
-        print(f"Error: Directory not found: {extracted_dir}")
+    if not args.source.exists():
+        print(f"Error: Document not found: {args.source}")
+        sys.exit(1)
+    if not args.source.is_dir() and not zipfile.is_zipfile(args.source):
+        print(f"Error: Not a document ZIP or extracted directory: {args.source}")
         sys.exit(1)
 
-    render_to_pdf(extracted_dir, output_path)
+    if args.benchmark:
+        benchmark_rendering(args.source)
+        return
+
+    if args.output_path is None:
+        parser.error("output_path is required unless --benchmark is given")
+
+    render_to_pdf(
+        args.source,
+        args.output_path,
+        jobs=args.jobs,
+        simplify=args.simplify,
+        force=args.force,
+        variable_width=not args.constant_width,
+    )
 
 
 if __name__ == "__main__":
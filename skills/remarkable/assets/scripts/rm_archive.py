@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""
+Read reMarkable documents straight from their ZIP archives.
+
+Shared by render-annotations.py and sync-morning-pages.py. A document
+downloaded with download.ts or backup.ts is a ZIP holding:
+
+    <doc-id>.content          page order and per-page metadata (JSON)
+    <doc-id>.metadata         visible name, parent, timestamps (JSON)
+    <doc-id>.pdf / .epub      original file, if any
+    <doc-id>/<page-id>.rm     one v6 scene file per annotated page
+
+open_document() returns the same read-only view for a ZIP or for an
+already-extracted directory. Members are only read when asked for, and
+page streams are decompressed on the fly, so nothing is written to disk.
+
+Example:
+    with open_document("Meeting_Notes.zip") as doc:
+        print(doc.metadata.get("visibleName"), len(doc.rm_files))
+        for name in doc.rm_files:
+            data = doc.read(name)
+"""
+
+from __future__ import annotations
+
+import json
+import zipfile
+from abc import ABC, abstractmethod
+from functools import cached_property
+from pathlib import Path, PurePosixPath
+from typing import BinaryIO, Optional, Union
+
+
+class Document(ABC):
+    """
+    Read-only view of a reMarkable document's files.
+
+    Member names are POSIX paths relative to the document root, e.g.
+    "abc-123/4f2e....rm". Subclasses provide the storage.
+    """
+
+    path: Path
+
+    @abstractmethod
+    def names(self) -> list[str]:
+        """Every member name in the document."""
+
+    @abstractmethod
+    def open(self, name: str) -> BinaryIO:
+        """Open a member as a binary stream."""
+
+    def local_path(self, name: str) -> Optional[Path]:
+        """Filesystem path of a member, if it exists as a plain file."""
+        return None
+
+    def read(self, name: str) -> bytes:
+        """Read a whole member."""
+        with self.open(name) as f:
+            return f.read()
+
+    def close(self) -> None:
+        pass
+
+    def __enter__(self) -> "Document":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def _find(self, suffix: str) -> Optional[str]:
+        return next((n for n in self.names() if n.endswith(suffix) and "/" not in n), None)
+
+    def _json(self, suffix: str) -> dict:
+        name = self._find(suffix)
+        if name is None:
+            return {}
+        try:
+            return json.loads(self.read(name))
+        except json.JSONDecodeError as e:
+            print(f"Warning: Failed to parse {name}: {e}")
+            return {}
+
+    @property
+    def content_name(self) -> Optional[str]:
+        return self._find(".content")
+
+    @cached_property
+    def content(self) -> dict:
+        """Parsed .content file, or {} if missing."""
+        return self._json(".content")
+
+    @cached_property
+    def metadata(self) -> dict:
+        """Parsed .metadata file, or {} if missing."""
+        return self._json(".metadata")
+
+    @property
+    def pdf_name(self) -> Optional[str]:
+        """Member name of the original PDF, if the document has one."""
+        return self._find(".pdf")
+
+    @property
+    def rm_files(self) -> list[PurePosixPath]:
+        """Every .rm page in the document, sorted by name."""
+        return sorted(PurePosixPath(n) for n in self.names() if n.endswith(".rm"))
+
+
+class ZipDocument(Document):
+    """A document read from its ZIP archive without extracting it."""
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self.zip = zipfile.ZipFile(self.path)
+        self._names = [n for n in self.zip.namelist() if not n.endswith("/")]
+
+    def names(self) -> list[str]:
+        return self._names
+
+    def open(self, name: str) -> BinaryIO:
+        return self.zip.open(str(name))
+
+    def close(self) -> None:
+        self.zip.close()
+
+
+class DirectoryDocument(Document):
+    """A document that was already extracted to a directory."""
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self._names = sorted(
+            p.relative_to(self.path).as_posix() for p in self.path.rglob("*") if p.is_file()
+        )
+
+    def names(self) -> list[str]:
+        return self._names
+
+    def open(self, name: str) -> BinaryIO:
+        return open(self.path / name, "rb")
+
+    def local_path(self, name: str) -> Optional[Path]:
+        return self.path / name
+
+
+def open_document(path: Union[str, Path]) -> Document:
+    """Open a document ZIP or extracted document directory."""
+    path = Path(path)
+    if path.is_dir():
+        return DirectoryDocument(path)
+    if zipfile.is_zipfile(path):
+        return ZipDocument(path)
+    raise ValueError(f"Not a document ZIP or directory: {path}")
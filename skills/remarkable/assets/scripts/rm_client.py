@@ -0,0 +1,214 @@
+#!/usr/bin/env python3
+"""
+Python client for the long-lived reMarkable API helper (serve.ts).
+
+Starting `npx tsx list.ts` or `download.ts` for every call pays Node
+startup, TypeScript transpilation and a fresh rmapi-js authentication
+each time. RemarkableClient starts serve.ts once and sends it JSON
+requests over a pipe, so one authenticated session and its document
+list serve a whole sync run. Calls are thread-safe and pipelined:
+concurrent downloads share the one helper process.
+
+Example:
+    with RemarkableClient() as client:
+        docs = client.list_documents()
+        client.download(docs[0]["hash"], Path("doc.zip"))
+
+Benchmark against one subprocess per call:
+    python rm_client.py --benchmark [--hash HASH] [--repeat 3]
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+import json
+import time
+import argparse
+import tempfile
+import threading
+import subprocess
+from concurrent.futures import Future, TimeoutError as FutureTimeout
+from pathlib import Path
+from typing import Any, Optional
+
+SCRIPTS_DIR = Path(__file__).parent
+SKILL_DIR = SCRIPTS_DIR.parent.parent
+
+# Seconds to wait for one call before the helper is presumed hung
+DEFAULT_TIMEOUT = 300
+
+
+class RemarkableError(RuntimeError):
+    """An API call failed in the helper, or the helper died."""
+
+    def __init__(self, name: str, message: str):
+        super().__init__(f"{name}: {message}")
+        self.name = name
+
+
+class RemarkableClient:
+    """
+    One serve.ts helper process, shared by every call.
+
+    The helper is started lazily on the first call and stopped by close()
+    (or leaving the with block). device_token, if given, is passed to the
+    helper so it doesn't query 1Password again. A call that gets no
+    answer within timeout seconds kills the helper, failing its other
+    in-flight calls; the next call starts a fresh one.
+    """
+
+    def __init__(self, device_token: Optional[str] = None, timeout: float = DEFAULT_TIMEOUT):
+        self.device_token = device_token
+        self.timeout = timeout
+        self._process: Optional[subprocess.Popen] = None
+        self._reader: Optional[threading.Thread] = None
+        # Calls awaiting the current helper; each helper's reader owns its own dict
+        self._pending: dict[int, Future] = {}
+        self._lock = threading.Lock()
+        self._next_id = 0
+
+    def __enter__(self) -> "RemarkableClient":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def _start(self) -> subprocess.Popen:
+        env = dict(os.environ)
+        if self.device_token:
+            env["REMARKABLE_DEVICE_TOKEN"] = self.device_token
+        self._process = subprocess.Popen(
+            ["npx", "tsx", str(SCRIPTS_DIR / "serve.ts")],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            text=True,
+            bufsize=1,
+            cwd=SKILL_DIR,
+            env=env,
+        )
+        self._pending = {}
+        self._reader = threading.Thread(
+            target=self._read_responses, args=(self._process, self._pending), daemon=True
+        )
+        self._reader.start()
+        return self._process
+
+    def _read_responses(self, process: subprocess.Popen, pending: dict[int, Future]) -> None:
+        """Resolve one helper's pending calls as responses arrive, in any order."""
+        for line in process.stdout:
+            try:
+                response = json.loads(line)
+            except json.JSONDecodeError:
+                continue  # stray output from a dependency
+            with self._lock:
+                future = pending.pop(response.get("id"), None)
+            if future is None:
+                continue
+            if "error" in response:
+                error = response["error"]
+                future.set_exception(RemarkableError(error.get("name", "Error"), error.get("message", "")))
+            else:
+                future.set_result(response.get("result"))
+
+        # Helper exited: fail whatever is still waiting on it
+        with self._lock:
+            orphans = list(pending.values())
+            pending.clear()
+        for future in orphans:
+            future.set_exception(RemarkableError("HelperExited", "serve.ts exited unexpectedly"))
+
+    def call(self, method: str, **params: Any) -> Any:
+        """Send one request and wait for its result."""
+        future: Future = Future()
+        with self._lock:
+            process = self._process if self._process and self._process.poll() is None else self._start()
+            self._next_id += 1
+            request_id = self._next_id
+            pending = self._pending
+            pending[request_id] = future
+            try:
+                process.stdin.write(json.dumps({"id": request_id, "method": method, "params": params}) + "\n")
+                process.stdin.flush()
+            except (BrokenPipeError, OSError):
+                pending.pop(request_id, None)
+                raise RemarkableError("HelperExited", "serve.ts is not running")
+        try:
+            return future.result(timeout=self.timeout)
+        except FutureTimeout:
+            with self._lock:
+                pending.pop(request_id, None)
+            # A hung helper would stall every later call; kill it so the
+            # reader fails the rest and the next call starts a new one
+            process.kill()
+            raise RemarkableError("Timeout", f"{method} got no answer in {self.timeout:g}s")
+
+    def list_documents(self, refresh: bool = False) -> list[dict]:
+        """Documents as name/hash/id/parent/path dicts, like `list.ts --json`."""
+        return self.call("list", refresh=refresh)
+
+    def download(self, doc_hash: str, path: Path) -> Path:
+        """Download a document's ZIP archive to path."""
+        result = self.call("download", hash=doc_hash, path=str(Path(path).resolve()))
+        return Path(result["path"])
+
+    def close(self) -> None:
+        """Stop the helper once its in-flight calls are answered."""
+        if self._process is None:
+            return
+        if self._process.stdin:
+            self._process.stdin.close()
+        try:
+            self._process.wait(timeout=30)
+        except subprocess.TimeoutExpired:
+            self._process.kill()
+        if self._reader:
+            self._reader.join(timeout=5)
+        self._process = None
+
+
+def benchmark(doc_hash: Optional[str], repeat: int) -> None:
+    """Time list + download via one subprocess per call vs. the helper."""
+    def per_call() -> None:
+        for _ in range(repeat):
+            subprocess.run(["npx", "tsx", str(SCRIPTS_DIR / "list.ts"), "--json"],
+                           capture_output=True, check=True, cwd=SKILL_DIR)
+            if doc_hash:
+                with tempfile.TemporaryDirectory() as tmp:
+                    subprocess.run(["npx", "tsx", str(SCRIPTS_DIR / "download.ts"),
+                                    "--hash", doc_hash, "--output", tmp],
+                                   capture_output=True, check=True, cwd=SKILL_DIR)
+
+    def helper() -> None:
+        with RemarkableClient() as client, tempfile.TemporaryDirectory() as tmp:
+            for _ in range(repeat):
+                client.list_documents()
+                if doc_hash:
+                    client.download(doc_hash, Path(tmp) / "doc.zip")
+
+    calls = repeat * (2 if doc_hash else 1)
+    print(f"Benchmarking {calls} call(s) ({'list + download' if doc_hash else 'list'} x {repeat})\n")
+    for name, run in [("subprocess per call", per_call), ("serve.ts helper", helper)]:
+        start = time.perf_counter()
+        run()
+        elapsed = time.perf_counter() - start
+        print(f"  {name:<22} {elapsed:7.2f} s  {elapsed / calls * 1000:8.0f} ms/call")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="reMarkable API helper client")
+    parser.add_argument("--benchmark", action="store_true",
+                        help="Time per-call subprocesses against the long-lived helper")
+    parser.add_argument("--hash", help="Also download this document in the benchmark")
+    parser.add_argument("--repeat", type=int, default=3, help="Iterations (default: 3)")
+    args = parser.parse_args()
+
+    if not args.benchmark:
+        parser.print_help()
+        sys.exit(1)
+
+    benchmark(args.hash, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
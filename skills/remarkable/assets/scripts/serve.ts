@@ -0,0 +1,122 @@
+#!/usr/bin/env npx tsx
+/**
+ * Long-lived reMarkable API helper for the Python scripts
+ *
+ * Reads one JSON request per line on stdin and writes one JSON response per
+ * line on stdout, so a single authenticated session (and its document list)
+ * serves every call of a sync run instead of one npx/tsx process per call.
+ *
+ * Requests:  {"id": 1, "method": "list", "params": {"refresh": false}}
+ *            {"id": 2, "method": "download", "params": {"hash": "...", "path": "out.zip"}}
+ * Responses: {"id": 1, "result": [...]}
+ *            {"id": 2, "error": {"name": "HashNotFoundError", "message": "..."}}
+ *
+ * Requests are handled concurrently; responses may arrive out of order.
+ * The process exits when stdin closes. Python callers use rm_client.py.
+ *
+ * Usage:
+ *   npx tsx serve.ts
+ */
+
+import { initApi, listItemsCached, getFolders, getPath } from "./common.js";
+import { writeFile, mkdir } from "fs/promises";
+import { dirname } from "path";
+import { createInterface } from "readline";
+import type { RemarkableApi, Entry } from "rmapi-js";
+
+interface Request {
+  id: number;
+  method: string;
+  params?: Record<string, unknown>;
+}
+
+interface DocumentInfo {
+  name: string;
+  hash: string;
+  id: string;
+  parent: string | undefined;
+  path: string;
+}
+
+let apiPromise: Promise<RemarkableApi> | undefined;
+let itemsPromise: Promise<Entry[]> | undefined;
+
+// Authenticate once, on first use; a failed attempt is retried by the next request
+function getApi(): Promise<RemarkableApi> {
+  if (!apiPromise) {
+    apiPromise = initApi();
+    apiPromise.catch(() => (apiPromise = undefined));
+  }
+  return apiPromise;
+}
+
+// Listing: checked against the root hash once per session unless a refresh is requested
+async function getItems(refresh: boolean): Promise<Entry[]> {
+  if (refresh || !itemsPromise) {
+    const api = await getApi();
+    itemsPromise = listItemsCached(api, refresh);
+    itemsPromise.catch(() => (itemsPromise = undefined));
+  }
+  return itemsPromise;
+}
+
+async function list(params: Record<string, unknown>): Promise<DocumentInfo[]> {
+  const items = await getItems(Boolean(params.refresh));
+  const folders = getFolders(items);
+  return items
+    .filter((i) => i.type === "DocumentType")
+    .map((doc) => ({
+      name: doc.visibleName,
+      hash: doc.hash,
+      id: doc.id,
+      parent: doc.parent,
+      path: getPath(doc, folders),
+    }));
+}
+
+async function download(params: Record<string, unknown>): Promise<{ path: string; size: number }> {
+  const hash = String(params.hash);
+  const path = String(params.path);
+  const api = await getApi();
+  const zipData = await api.getDocument(hash);
+  await mkdir(dirname(path), { recursive: true });
+  await writeFile(path, zipData);
+  return { path, size: zipData.byteLength };
+}
+
+const methods: Record<string, (params: Record<string, unknown>) => Promise<unknown>> = {
+  list,
+  download,
+};
+
+function respond(message: object): void {
+  process.stdout.write(JSON.stringify(message) + "\n");
+}
+
+async function handle(line: string): Promise<void> {
+  let request: Request;
+  try {
+    request = JSON.parse(line);
+  } catch {
+    respond({ id: null, error: { name: "ParseError", message: `Invalid request: ${line}` } });
+    return;
+  }
+
+  const method = methods[request.method];
+  if (!method) {
+    respond({ id: request.id, error: { name: "MethodNotFound", message: `Unknown method: ${request.method}` } });
+    return;
+  }
+
+  try {
+    respond({ id: request.id, result: await method(request.params ?? {}) });
+  } catch (error) {
+    const err = error instanceof Error ? error : new Error(String(error));
+    respond({ id: request.id, error: { name: err.name, message: err.message } });
+  }
+}
+
+const input = createInterface({ input: process.stdin });
+input.on("line", (line) => {
+  if (line.trim()) void handle(line);
+});
@@ -10,10 +10,17 @@ This script:
 
 Usage:
     python sync-morning-pages.py [--force] [--dry-run]
+    python sync-morning-pages.py --all [--jobs N]
+    python sync-morning-pages.py --since 2025-09 [--until 2025-12]
 
 Options:
-    --force    Re-download even if cached version exists
+    --force    Re-download and re-extract every page and re-check every note,
+               ignoring all caches
     --dry-run  Show what would be synced without making changes
+    --all      Sync every Morning Pages notebook, not just the latest
+    --since/--until YYYY-MM
+               Sync the notebooks in a month range
+    --jobs N   Concurrent downloads and extraction processes (default: 4)
 
 Configuration:
     Set OBSIDIAN_DAILY_PATH environment variable or edit DEFAULT_OBSIDIAN_PATH below.
@@ -21,14 +28,23 @@ Configuration:
 
 from __future__ import annotations
 
+import io
 import os
 import sys
 import json
+import argparse
 import hashlib
+import shutil
 import subprocess
+from contextlib import nullcontext
 from pathlib import Path
-from datetime import datetime
+from datetime import datetime, timedelta
 from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import BinaryIO
+
+from rm_archive import open_document
+from rm_client import RemarkableClient, RemarkableError
 
 # Try to import rmscene - will fail gracefully if not installed
 RMSCENE_AVAILABLE = False
@@ -87,6 +103,15 @@ DEFAULT_OBSIDIAN_PATH = Path(os.environ.get(
 CACHE_DIR = Path(__file__).parent.parent.parent / "data" / "cache"
 DOWNLOAD_DIR = Path(__file__).parent.parent.parent / "data" / "downloads"
 
+# Per-page extraction cache; bump the version when extraction output changes
+PAGE_CACHE_FILE = CACHE_DIR / "morning_pages_pages.json"
+PAGE_CACHE_VERSION = 3
+# Notebooks not synced for this many days are dropped from the page cache
+PAGE_CACHE_MAX_AGE_DAYS = 60
+
+# Synced-section index: date -> section hash and the note's size/mtime
+SECTION_INDEX_FILE = CACHE_DIR / "morning_pages_index.json"
+
 # 1Password item name for reMarkable device token
 # Override with OP_REMARKABLE_ITEM env var if you have naming conflicts
 OP_ITEM_NAME = os.environ.get("OP_REMARKABLE_ITEM", "Remarkable")
@@ -129,85 +154,94 @@ def extract_date_from_name(name: str) -> str:
     return "0000-00"  # Sort unknown dates first
 
 
-def find_morning_pages_document(device_token: str) -> dict | None:
-    """Find the latest Morning Pages document on reMarkable."""
-    # Use the TypeScript list script to get documents
-    result = subprocess.run(
-        ["npx", "tsx", str(Path(__file__).parent / "list.ts"), "--json"],
-        capture_output=True,
-        text=True,
-        cwd=Path(__file__).parent.parent.parent,
-    )
-
-    if result.returncode != 0:
-        print(f"Error listing documents: {result.stderr}")
-        return None
+def find_morning_pages_documents(
+    client: RemarkableClient, since: str | None = None, until: str | None = None
+) -> list[dict] | None:
+    """
+    Find Morning Pages documents on reMarkable, oldest month first.
 
-    documents = json.loads(result.stdout)
+    since and until are inclusive YYYY-MM bounds on the month in the
+    notebook name. Returns None if the document list can't be fetched.
+    """
+    try:
+        documents = client.list_documents()
+    except RemarkableError as e:
+        print(f"Error listing documents: {e}")
+        return None
 
     # Find documents matching "Morning Pages YYYY-MM" pattern (case-insensitive)
     morning_pages = []
     for doc in documents:
         name = doc.get("name", "")
-        if name.lower().startswith("morning pages"):
-            morning_pages.append(doc)
+        if not name.lower().startswith("morning pages"):
+            continue
+        month = extract_date_from_name(name)
+        if (since and month < since) or (until and month > until):
+            continue
+        morning_pages.append(doc)
+
+    # Sort by extracted date (YYYY-MM)
+    morning_pages.sort(key=lambda d: extract_date_from_name(d["name"]))
+    return morning_pages
+
+
+def find_morning_pages_document(client: RemarkableClient) -> dict | None:
+    """Find the latest Morning Pages document on reMarkable."""
+    morning_pages = find_morning_pages_documents(client)
+    if morning_pages is None:
+        return None
 
     if not morning_pages:
         print("No Morning Pages documents found")
         return None
 
-    # Sort by extracted date (YYYY-MM) to get the latest month
-    morning_pages.sort(key=lambda d: extract_date_from_name(d["name"]))
     latest = morning_pages[-1]
 
     print(f"Found: {latest['name']} (hash: {latest['hash'][:8]})")
     return latest
 
 
-def download_document(doc: dict, force: bool = False) -> Path | None:
-    """Download document if not already cached or if forced."""
+def notebook_key(doc: dict) -> str:
+    """Stable key for a notebook across edits (its document id)."""
+    return doc.get("id") or doc["hash"][:16]
+
+
+def status(message: str) -> None:
+    """Print a line in one write, so concurrent downloads don't interleave."""
+    sys.stdout.write(message + "\n")
+
+
+def download_document(doc: dict, client: RemarkableClient, force: bool = False) -> Path | None:
+    """
+    Download document if not already cached or if forced.
+
+    Returns the path of the document ZIP. Pages are read straight from the
+    archive, so it is never extracted. Each notebook downloads into its
+    own directory, so several can be fetched at once.
+    """
     cache_file = CACHE_DIR / f"morning_pages_{doc['hash'][:16]}.json"
-    download_path = DOWNLOAD_DIR / "morning_pages_latest"
+    download_path = DOWNLOAD_DIR / "morning_pages" / notebook_key(doc)
     zip_path = download_path / f"{doc['hash'][:16]}.zip"
-    extracted_path = download_path / "extracted"
 
     # Check if already downloaded
-    if not force and cache_file.exists() and extracted_path.exists():
+    if not force and cache_file.exists() and zip_path.exists():
         cache_data = json.loads(cache_file.read_text())
         if cache_data.get("hash") == doc["hash"]:
-            print(f"Using cached version (hash matches)")
-            return extracted_path
+            status(f"   Using cached {doc['name']} (hash matches)")
+            return zip_path
 
     # Download fresh
-    print(f"Downloading {doc['name']}...")
-    download_path.mkdir(parents=True, exist_ok=True)
-
-    result = subprocess.run(
-        ["npx", "tsx", str(Path(__file__).parent / "download.ts"),
-         "--hash", doc["hash"], "--output", str(download_path)],
-        capture_output=True,
-        text=True,
-        cwd=Path(__file__).parent.parent.parent,
-    )
-
-    if result.returncode != 0:
-        print(f"Error downloading: {result.stderr}")
-        return None
-
-    # Find and extract ZIP
-    zip_files = list(download_path.glob("*.zip"))
-    if not zip_files:
-        print("Error: No ZIP file found after download")
+    status(f"   Downloading {doc['name']}...")
+    try:
+        client.download(doc["hash"], zip_path)
+    except RemarkableError as e:
+        status(f"Error downloading {doc['name']}: {e}")
         return None
 
-    # Extract
-    import zipfile
-    if extracted_path.exists():
-        import shutil
-        shutil.rmtree(extracted_path)
-
-    with zipfile.ZipFile(zip_files[0], 'r') as zf:
-        zf.extractall(extracted_path)
+    # Drop archives of older versions
+    for stale in download_path.glob("*.zip"):
+        if stale != zip_path:
+            stale.unlink()
 
     # Save cache metadata
     CACHE_DIR.mkdir(parents=True, exist_ok=True)
@@ -217,8 +251,8 @@ def download_document(doc: dict, force: bool = False) -> Path | None:
         "downloaded": datetime.now().isoformat(),
     }))
 
-    print(f"Extracted to {extracted_path}")
-    return extracted_path
+    status(f"   Saved {doc['name']} to {zip_path}")
+    return zip_path
 
 
 # Numbered list style values discovered from rmscene warnings
@@ -339,10 +373,12 @@ def is_list_style(style) -> bool:
     ) or is_numbered_list_style(style_value)
 
 
-def extract_text_from_rm(rm_file: Path) -> str:
+def extract_text_from_rm(rm_file: Path | BinaryIO) -> str:
     """
     Extract text content from a .rm file with proper Markdown formatting.
 
+    rm_file is a path or an open binary stream, such as a ZIP member.
+
     Uses TextDocument.from_scene_item() to parse paragraph styles and
     converts them to Markdown syntax (headers, bullets, checkboxes, bold,
     and numbered lists).
@@ -360,7 +396,8 @@ def extract_text_from_rm(rm_file: Path) -> str:
         return ""
 
     try:
-        with open(rm_file, 'rb') as f:
+        stream = open(rm_file, 'rb') if isinstance(rm_file, (str, Path)) else nullcontext(rm_file)
+        with stream as f:
             tree = read_tree(f)
 
             if not tree.root_text:
@@ -459,59 +496,203 @@ def extract_date_from_content(text: str) -> str | None:
     return None
 
 
-def extract_pages_with_dates(extracted_path: Path) -> dict[str, list[str]]:
+def load_page_cache() -> dict[str, dict]:
+    """
+    Load cached page extractions, keyed by notebook.
+
+    Each notebook maps to the date it was last synced and its pages, keyed
+    by page id. A page entry holds the page's .rm SHA-256, its Markdown
+    and the date found in its content (or None). Returns {} if the cache
+    is missing, unreadable or from another cache version.
+    """
+    try:
+        cache = json.loads(PAGE_CACHE_FILE.read_text())
+    except (FileNotFoundError, json.JSONDecodeError, OSError):
+        return {}
+    if cache.get("version") != PAGE_CACHE_VERSION:
+        return {}
+    return cache.get("notebooks", {})
+
+
+def save_page_cache(notebooks: dict[str, dict]) -> None:
+    """Write the page cache atomically."""
+    PAGE_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+    tmp_file = PAGE_CACHE_FILE.with_name(PAGE_CACHE_FILE.name + ".tmp")
+    tmp_file.write_text(json.dumps({"version": PAGE_CACHE_VERSION, "notebooks": notebooks}))
+    tmp_file.replace(PAGE_CACHE_FILE)
+
+
+def extract_page(data: bytes) -> dict:
+    """Extract one page's Markdown and content date from its .rm data."""
+    text = extract_text_from_rm(io.BytesIO(data))
+    if not text.strip():
+        return {"text": "", "date": None}
+    # Normalize line breaks for Markdown
+    text = normalize_for_markdown(text)
+    return {"text": text, "date": extract_date_from_content(text)}
+
+
+def extract_pages_with_dates(
+    source: Path, cached_pages: dict[str, dict] | None = None
+) -> tuple[dict[str, list[str]], dict[str, dict], int]:
     """
     Extract text from all pages, organized by date.
 
+    source is the document ZIP (or an extracted copy of it).
+
     Date detection priority:
     1. Parse date from content (e.g., "# 2026-01-24" heading)
     2. Fall back to page modification timestamp
 
     This handles retrospective writing (typing paper notes days later).
+
+    Pages whose .rm content hash matches their entry in cached_pages reuse
+    the cached Markdown without parsing. Returns the day texts, the page
+    entries to cache for this notebook, and the number of pages parsed.
     """
-    # Load content file to get page timestamps as fallback
-    content_files = list(extracted_path.glob("*.content"))
-    if not content_files:
-        print("Error: No .content file found")
-        return {}
+    cached_pages = cached_pages or {}
+    pages = {}
+    parsed = 0
 
-    content = json.loads(content_files[0].read_text())
+    with open_document(source) as document:
+        # Load content file to get page timestamps as fallback
+        if not document.content_name:
+            print(f"Error: No .content file found in {source}")
+            return {}, {}, 0
 
-    # Build page -> timestamp date mapping (fallback)
-    page_timestamp_dates = {}
-    for page in content.get('cPages', {}).get('pages', []):
-        page_id = page.get('id', '')
-        modified_ms = int(page.get('modifed', 0))  # Note: reMarkable typo
-        if modified_ms and page_id:
-            date = datetime.fromtimestamp(modified_ms / 1000).strftime('%Y-%m-%d')
-            page_timestamp_dates[page_id] = date
+        content = document.content
 
-    # Extract text from each .rm file
-    day_texts = defaultdict(list)
+        # Build page -> timestamp date mapping (fallback)
+        page_timestamp_dates = {}
+        for page in content.get('cPages', {}).get('pages', []):
+            page_id = page.get('id', '')
+            modified_ms = int(page.get('modifed', 0))  # Note: reMarkable typo
+            if modified_ms and page_id:
+                date = datetime.fromtimestamp(modified_ms / 1000).strftime('%Y-%m-%d')
+                page_timestamp_dates[page_id] = date
+
+        # Extract text from each .rm file
+        day_texts = defaultdict(list)
+
+        for rm_file in document.rm_files:
+            page_id = rm_file.stem
+            fallback_date = page_timestamp_dates.get(page_id, 'unknown')
+
+            data = document.read(str(rm_file))
+            digest = hashlib.sha256(data).hexdigest()
+            page = cached_pages.get(page_id)
+            if page is None or page.get("hash") != digest:
+                page = {"hash": digest, **extract_page(data)}
+                parsed += 1
+            pages[page_id] = page
 
-    for rm_file in sorted(extracted_path.rglob('*.rm')):
-        page_id = rm_file.stem
-        fallback_date = page_timestamp_dates.get(page_id, 'unknown')
+            if page["text"]:
+                # Prefer the date from content (handles retrospective writing)
+                day_texts[page["date"] or fallback_date].append(page["text"])
 
-        text = extract_text_from_rm(rm_file)
-        if text.strip():
-            # Normalize line breaks for Markdown
-            text = normalize_for_markdown(text)
+    return dict(day_texts), pages, parsed
 
-            # Try to extract date from content first (handles retrospective writing)
-            content_date = extract_date_from_content(text)
-            date = content_date if content_date else fallback_date
 
-            day_texts[date].append(text)
+def _extract_notebook_job(job: tuple[Path, dict[str, dict]]) -> tuple[dict, dict, int]:
+    """Worker entry point for extracting one notebook in a process pool."""
+    return extract_pages_with_dates(*job)
+
+
+def extract_notebooks(
+    notebooks: list[tuple[str, Path]], use_cache: bool = True, jobs: int = 1
+) -> dict[str, list[str]]:
+    """
+    Extract every notebook and merge their pages by date.
+
+    notebooks is a list of (notebook key, ZIP path), oldest first. With
+    jobs > 1 and several notebooks, extraction runs in a process pool.
+    Day texts are merged in notebook order, so a date spanning two
+    notebooks lists the older notebook's pages first.
+
+    These notebooks' entries in the page cache are replaced, which drops
+    their deleted pages. Other notebooks are kept, so syncing one month
+    doesn't evict the rest, until they go PAGE_CACHE_MAX_AGE_DAYS without
+    a sync. With use_cache False, cached pages are ignored but the cache
+    is still updated.
+    """
+    cache = load_page_cache()
+    job_list = [(zip_path, cache.get(key, {}).get("pages", {}) if use_cache else {})
+                for key, zip_path in notebooks]
+
+    if jobs > 1 and len(job_list) > 1:
+        with ProcessPoolExecutor(max_workers=min(jobs, len(job_list))) as pool:
+            results = list(pool.map(_extract_notebook_job, job_list))
+    else:
+        results = [extract_pages_with_dates(*job) for job in job_list]
+
+    today = datetime.now().strftime("%Y-%m-%d")
+    cutoff = (datetime.now() - timedelta(days=PAGE_CACHE_MAX_AGE_DAYS)).strftime("%Y-%m-%d")
+    day_texts = defaultdict(list)
+    new_cache = {key: entry for key, entry in cache.items() if entry.get("synced", "") >= cutoff}
+    parsed = total = 0
+    for (key, _), (notebook_days, pages, notebook_parsed) in zip(notebooks, results):
+        for date, texts in notebook_days.items():
+            day_texts[date].extend(texts)
+        new_cache[key] = {"synced": today, "pages": pages}
+        parsed += notebook_parsed
+        total += len(pages)
+
+    evicted = sum(len(set(entry.get("pages", {})) - set(new_cache.get(key, {}).get("pages", {})))
+                  for key, entry in cache.items())
+    print(f"   Parsed {parsed} of {total} page(s)"
+          + (f", evicted {evicted} cached page(s)" if evicted else ""))
+    save_page_cache(new_cache)
 
     return dict(day_texts)
 
 
-def sync_to_obsidian(day_texts: dict[str, list[str]], obsidian_path: Path, dry_run: bool = False) -> dict:
-    """Sync extracted text to Obsidian daily notes."""
+def load_section_index(obsidian_path: Path) -> dict[str, dict]:
+    """
+    Load the synced-section index for an Obsidian folder.
+
+    Maps each date to the SHA-256 of the Morning Pages section last
+    written to its note, plus the note's size and mtime at that point.
+    Returns {} if the index is missing or was built for another folder.
+    """
+    try:
+        index = json.loads(SECTION_INDEX_FILE.read_text())
+    except (FileNotFoundError, json.JSONDecodeError, OSError):
+        return {}
+    if index.get("obsidian_path") != str(obsidian_path):
+        return {}
+    return index.get("notes", {})
+
+
+def save_section_index(obsidian_path: Path, notes: dict[str, dict]) -> None:
+    """Write the synced-section index atomically."""
+    SECTION_INDEX_FILE.parent.mkdir(parents=True, exist_ok=True)
+    tmp_file = SECTION_INDEX_FILE.with_name(SECTION_INDEX_FILE.name + ".tmp")
+    tmp_file.write_text(json.dumps({"obsidian_path": str(obsidian_path), "notes": notes}, indent=2))
+    tmp_file.replace(SECTION_INDEX_FILE)
+
+
+def index_entry(section_hash: str, obsidian_file: Path) -> dict:
+    """Index entry for a note whose Morning Pages section has the given hash."""
+    stat = obsidian_file.stat()
+    return {"hash": section_hash, "size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+
+
+def sync_to_obsidian(day_texts: dict[str, list[str]], obsidian_path: Path, dry_run: bool = False,
+                     force: bool = False) -> dict:
+    """
+    Sync extracted text to Obsidian daily notes.
+
+    A day is skipped without opening its note when the index says its
+    section was already written with the same content, and the note's
+    size and mtime are unchanged since. Notes edited in the meantime are
+    read and their section compared directly. With force, the index is
+    ignored and every note is read.
+    """
     stats = {"created": 0, "merged": 0, "skipped": 0}
 
     obsidian_path.mkdir(parents=True, exist_ok=True)
+    index = load_section_index(obsidian_path)
+    index_changed = False
 
     for date in sorted(day_texts.keys()):
         if date == 'unknown':
@@ -519,29 +700,40 @@ def sync_to_obsidian(day_texts: dict[str, list[str]], obsidian_path: Path, dry_r
 
         texts = day_texts[date]
         combined_text = '\n\n'.join(texts)
+        section = '## Morning Pages\n\n' + combined_text + '\n'
+        section_hash = hashlib.sha256(section.encode()).hexdigest()
 
         obsidian_file = obsidian_path / f'{date}.md'
 
+        # Fast path: same section as last sync and the note is untouched
+        entry = None if force else index.get(date)
+        if entry and entry.get("hash") == section_hash:
+            try:
+                stat = obsidian_file.stat()
+            except FileNotFoundError:
+                stat = None
+            if stat and [stat.st_size, stat.st_mtime_ns] == [entry.get("size"), entry.get("mtime_ns")]:
+                stats["skipped"] += 1
+                continue
+
         if obsidian_file.exists():
             existing = obsidian_file.read_text()
 
             # Check if Morning Pages section already exists
             if '## Morning Pages' in existing:
-                # Check if content is different (update detection)
+                # Morning Pages is always the last section, so compare to end of file
                 existing_mp_start = existing.find('## Morning Pages')
                 existing_mp_section = existing[existing_mp_start:]
 
-                # Simple hash comparison for changes
-                existing_hash = hashlib.md5(existing_mp_section.encode()).hexdigest()[:8]
-                new_hash = hashlib.md5(combined_text.encode()).hexdigest()[:8]
-
-                if existing_hash == new_hash:
+                if existing_mp_section == section:
                     stats["skipped"] += 1
+                    if not dry_run:
+                        index[date] = index_entry(section_hash, obsidian_file)
+                        index_changed = True
                     continue
 
                 # Content changed - replace the entire Morning Pages section
-                # Morning Pages is always the last section, so replace to end of file
-                new_content = existing[:existing_mp_start] + '## Morning Pages\n\n' + combined_text + '\n'
+                new_content = existing[:existing_mp_start] + section
 
                 if not dry_run:
                     obsidian_file.write_text(new_content)
@@ -549,29 +741,56 @@ def sync_to_obsidian(day_texts: dict[str, list[str]], obsidian_path: Path, dry_r
                 stats["merged"] += 1
             else:
                 # Append Morning Pages section
-                new_content = existing.rstrip() + '\n\n## Morning Pages\n\n' + combined_text + '\n'
+                new_content = existing.rstrip() + '\n\n' + section
                 if not dry_run:
                     obsidian_file.write_text(new_content)
                 print(f"  MERGE {date} - Added Morning Pages section")
                 stats["merged"] += 1
         else:
             # Create new daily note
-            new_content = DEFAULT_FRONTMATTER + '## Morning Pages\n\n' + combined_text + '\n'
+            new_content = DEFAULT_FRONTMATTER + section
             if not dry_run:
                 obsidian_file.write_text(new_content)
             print(f"  CREATE {date} - New daily note")
             stats["created"] += 1
 
+        if not dry_run:
+            index[date] = index_entry(section_hash, obsidian_file)
+            index_changed = True
+
+    if index_changed:
+        save_section_index(obsidian_path, index)
+
     return stats
 
 
+def month_arg(value: str) -> str:
+    """argparse type for YYYY-MM month bounds."""
+    try:
+        return datetime.strptime(value, "%Y-%m").strftime("%Y-%m")
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected YYYY-MM, got {value!r}")
+
+
 def main():
-    import argparse
     parser = argparse.ArgumentParser(description="Sync Morning Pages from reMarkable to Obsidian")
-    parser.add_argument("--force", action="store_true", help="Force re-download")
+    parser.add_argument("--force", action="store_true",
+                        help="Ignore all caches: re-download, re-extract and re-check every note")
     parser.add_argument("--dry-run", action="store_true", help="Show changes without applying")
+    parser.add_argument("--all", action="store_true",
+                        help="Sync every Morning Pages notebook, not just the latest")
+    parser.add_argument("--since", type=month_arg, metavar="YYYY-MM",
+                        help="Sync notebooks from this month on")
+    parser.add_argument("--until", type=month_arg, metavar="YYYY-MM",
+                        help="Sync notebooks up to this month")
+    parser.add_argument("--jobs", "-j", type=int, default=4, metavar="N",
+                        help="Concurrent downloads and extraction processes (default: 4)")
     args = parser.parse_args()
 
+    if args.jobs < 1:
+        print("Error: --jobs must be at least 1")
+        sys.exit(1)
+
     # Get Obsidian path from env or default
     obsidian_path = Path(os.environ.get("OBSIDIAN_DAILY_PATH", DEFAULT_OBSIDIAN_PATH))
 
@@ -585,21 +804,42 @@ def main():
     print("1. Authenticating...")
     device_token = get_device_token()
 
-    # Step 2: Find latest Morning Pages
-    print("\n2. Finding latest Morning Pages...")
-    doc = find_morning_pages_document(device_token)
-    if not doc:
-        sys.exit(1)
-
-    # Step 3: Download if needed
-    print("\n3. Downloading...")
-    extracted_path = download_document(doc, force=args.force)
-    if not extracted_path:
+    # Steps 2-3 share one API helper process (and its document list)
+    with RemarkableClient(device_token) as client:
+        # Step 2: Find latest Morning Pages, or every notebook in range
+        if args.all or args.since or args.until:
+            print("\n2. Finding Morning Pages notebooks...")
+            docs = find_morning_pages_documents(client, since=args.since, until=args.until)
+            if not docs:
+                if docs is not None:
+                    print("No Morning Pages documents found")
+                sys.exit(1)
+            print(f"   Found {len(docs)} notebook(s): {', '.join(doc['name'] for doc in docs)}")
+        else:
+            print("\n2. Finding latest Morning Pages...")
+            doc = find_morning_pages_document(client)
+            if not doc:
+                sys.exit(1)
+            docs = [doc]
+
+        # Step 3: Download changed notebooks, a few at a time
+        print("\n3. Downloading...")
+        # Remove the download directory used before notebooks had their own
+        legacy_path = DOWNLOAD_DIR / "morning_pages_latest"
+        if legacy_path.exists():
+            shutil.rmtree(legacy_path, ignore_errors=True)
+        with ThreadPoolExecutor(max_workers=min(args.jobs, len(docs))) as pool:
+            zip_paths = list(pool.map(lambda d: download_document(d, client, force=args.force), docs))
+
+    failed = [doc["name"] for doc, zip_path in zip(docs, zip_paths) if not zip_path]
+    if failed:
+        print(f"Error: {len(failed)} download(s) failed: {', '.join(failed)}")
         sys.exit(1)
 
     # Step 4: Extract text
     print("\n4. Extracting text...")
-    day_texts = extract_pages_with_dates(extracted_path)
+    notebooks = [(notebook_key(doc), zip_path) for doc, zip_path in zip(docs, zip_paths)]
+    day_texts = extract_notebooks(notebooks, use_cache=not args.force, jobs=args.jobs)
     print(f"   Found {len(day_texts)} days with content")
 
     # Step 5: Sync to Obsidian
@@ -607,7 +847,7 @@ def main():
     if args.dry_run:
         print("   (DRY RUN - no changes will be made)")
 
-    stats = sync_to_obsidian(day_texts, obsidian_path, dry_run=args.dry_run)
+    stats = sync_to_obsidian(day_texts, obsidian_path, dry_run=args.dry_run, force=args.force)
 
     # Summary
     print(f"\n=== Summary ===")
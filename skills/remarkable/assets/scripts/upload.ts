@@ -8,7 +8,7 @@
  *   npx tsx upload.ts <file.pdf> --folder "Folder Name"
  */
 
-import { initApi, findDocuments, safeName } from "./common.js";
+import { initApi, listItemsCached, findDocuments, safeName } from "./common.js";
 import { readFile } from "fs/promises";
 import { basename } from "path";
 
@@ -74,7 +74,7 @@ async function main() {
   // Find folder if specified
   let parentId: string | undefined;
   if (folder) {
-    const items = await api.listItems();
+    const items = await listItemsCached(api);
     const folders = items.filter((i) => i.type === "CollectionType");
     const match = folders.find(
       (f) => f.visibleName.toLowerCase() === folder.toLowerCase()
@@ -8,7 +8,12 @@ by creating valid CRDT sequence items.
 Usage:
     python write-text-poc.py <document_uuid> <page_uuid> "Text to append"
     python write-text-poc.py --list  # List available documents
+    python write-text-poc.py --list --name journal --sort name --offset 20
     python write-text-poc.py --dry-run <doc> <page> "Text"  # Preview without writing
+    python write-text-poc.py --batch ops.jsonl  # Many appends, one write per page
+
+A batch file holds one {"doc": ..., "page": ..., "text": ...} object per
+line (or a JSON list of them); "-" reads it from stdin.
 
 Requirements:
     - rmscene library: uv pip install rmscene
@@ -21,8 +26,11 @@ from __future__ import annotations
 
 import argparse
 import json
+import os
 import shutil
+import sqlite3
 import sys
+from collections import defaultdict
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
@@ -42,11 +50,28 @@ except ImportError:
 # Configuration
 DESKTOP_DATA_DIR = Path.home() / "Library/Containers/com.remarkable.desktop/Data/Library/Application Support/remarkable/desktop"
 STATE_FILE = Path(__file__).parent.parent.parent / "data" / "crdt_state.json"
+CATALOG_FILE = STATE_FILE.parent / "desktop_catalog.sqlite"
+CATALOG_VERSION = 1
+
+# --sort choices for --list, as SQL ORDER BY terms
+CATALOG_SORTS = {
+    "modified": "modified DESC",
+    "name": "name COLLATE NOCASE",
+    "pages": "page_count DESC",
+}
 
 # Use author ID 2 (tablet typically uses 1)
 DEFAULT_AUTHOR_ID = 2
 
 
+@dataclass
+class TextOperation:
+    """One text append: text goes to the end of a document page."""
+    doc_id: str
+    page_id: str
+    text: str
+
+
 @dataclass
 class CrdtState:
     """Track CRDT state for generating new IDs."""
@@ -58,6 +83,17 @@ class CrdtState:
         self.last_sequence += 1
         return CrdtId(self.author_id, self.last_sequence)
 
+    def allocate(self, count: int) -> CrdtId:
+        """
+        Reserve a block of count consecutive IDs and return the first.
+
+        A text item takes one ID per character (item_id + offset), so an
+        n-character item needs a block of n IDs.
+        """
+        first = CrdtId(self.author_id, self.last_sequence + 1)
+        self.last_sequence += count
+        return first
+
     def save(self, path: Path):
         """Save state to JSON file."""
         path.parent.mkdir(parents=True, exist_ok=True)
@@ -79,57 +115,219 @@ class CrdtState:
         return cls(author_id=author_id, last_sequence=0)
 
 
-def list_documents() -> list[dict]:
-    """List all documents in the desktop app's local storage."""
-    documents = []
+class DesktopCatalog:
+    """
+    SQLite catalog of the desktop app's documents and pages.
 
-    if not DESKTOP_DATA_DIR.exists():
-        print(f"Desktop data directory not found: {DESKTOP_DATA_DIR}")
-        return documents
+    refresh() stats the data directory and only re-reads a document's
+    .metadata, .content or page folder when its mtime changed since the
+    previous refresh, so listing a large library doesn't parse every file.
+    """
 
-    for metadata_file in DESKTOP_DATA_DIR.glob("*.metadata"):
-        doc_id = metadata_file.stem
+    def __init__(self, path: Path = CATALOG_FILE, data_dir: Path | None = None):
+        self.data_dir = data_dir or DESKTOP_DATA_DIR
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(path)
+        self.conn.row_factory = sqlite3.Row
+        if self.conn.execute("PRAGMA user_version").fetchone()[0] != CATALOG_VERSION:
+            self.conn.executescript(f"""
+                DROP TABLE IF EXISTS documents;
+                DROP TABLE IF EXISTS pages;
+                CREATE TABLE documents (
+                    id TEXT PRIMARY KEY,
+                    name TEXT NOT NULL,
+                    type TEXT NOT NULL,
+                    modified INTEGER NOT NULL,
+                    page_count INTEGER NOT NULL,
+                    metadata_mtime INTEGER NOT NULL,
+                    content_mtime INTEGER NOT NULL,
+                    folder_mtime INTEGER NOT NULL
+                );
+                CREATE INDEX documents_modified ON documents (modified);
+                CREATE TABLE pages (
+                    doc_id TEXT NOT NULL,
+                    position INTEGER NOT NULL,
+                    id TEXT NOT NULL,
+                    template TEXT NOT NULL,
+                    PRIMARY KEY (doc_id, position)
+                );
+                PRAGMA user_version = {CATALOG_VERSION};
+            """)
+
+    def __enter__(self) -> "DesktopCatalog":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.conn.close()
+
+    def refresh(self) -> dict[str, int]:
+        """Bring the catalog up to date with the data directory."""
+        stats = {"documents": 0, "updated": 0, "removed": 0}
+        if not self.data_dir.exists():
+            return stats
+
+        # One directory scan: mtimes of every .metadata, .content and page folder
+        metadata_mtimes, content_mtimes, folder_mtimes = {}, {}, {}
+        with os.scandir(self.data_dir) as entries:
+            for entry in entries:
+                if entry.name.endswith(".metadata"):
+                    metadata_mtimes[entry.name[:-len(".metadata")]] = entry.stat().st_mtime_ns
+                elif entry.name.endswith(".content"):
+                    content_mtimes[entry.name[:-len(".content")]] = entry.stat().st_mtime_ns
+                elif entry.is_dir():
+                    folder_mtimes[entry.name] = entry.stat().st_mtime_ns
+
+        known = {
+            row["id"]: row for row in self.conn.execute(
+                "SELECT id, metadata_mtime, content_mtime, folder_mtime FROM documents")
+        }
+        stats["documents"] = len(metadata_mtimes)
+
+        with self.conn:
+            for doc_id in known.keys() - metadata_mtimes.keys():
+                self._remove(doc_id)
+                stats["removed"] += 1
+
+            for doc_id, metadata_mtime in metadata_mtimes.items():
+                if self._refresh_row(doc_id, known.get(doc_id), metadata_mtime,
+                                     content_mtimes.get(doc_id, 0), folder_mtimes.get(doc_id, 0)):
+                    stats["updated"] += 1
+
+        return stats
+
+    def refresh_document(self, doc_id: str) -> bool:
+        """
+        Bring one document's row up to date, without scanning the library.
+
+        Returns False if the document doesn't exist (its row is dropped).
+        """
+        def mtime(path: Path) -> int | None:
+            try:
+                return path.stat().st_mtime_ns
+            except OSError:
+                return None
+
+        metadata_mtime = mtime(self.data_dir / f"{doc_id}.metadata")
+        row = self.conn.execute(
+            "SELECT id, metadata_mtime, content_mtime, folder_mtime FROM documents WHERE id = ?",
+            (doc_id,),
+        ).fetchone()
+        with self.conn:
+            if metadata_mtime is None:
+                self._remove(doc_id)
+                return False
+            folder = self.data_dir / doc_id
+            self._refresh_row(doc_id, row, metadata_mtime,
+                              mtime(self.data_dir / f"{doc_id}.content") or 0,
+                              (mtime(folder) or 0) if folder.is_dir() else 0)
+        return True
+
+    def _refresh_row(self, doc_id: str, row: sqlite3.Row | None,
+                     metadata_mtime: int, content_mtime: int, folder_mtime: int) -> bool:
+        """Re-read a document if its mtimes differ from row; returns whether it did."""
+        if row and (row["metadata_mtime"], row["content_mtime"], row["folder_mtime"]) == (
+                metadata_mtime, content_mtime, folder_mtime):
+            return False
         try:
-            metadata = json.loads(metadata_file.read_text())
-            doc_folder = DESKTOP_DATA_DIR / doc_id
-            page_count = len(list(doc_folder.glob("*.rm"))) if doc_folder.exists() else 0
-
-            documents.append({
-                "id": doc_id,
-                "name": metadata.get("visibleName", "Unknown"),
-                "type": metadata.get("type", "Unknown"),
-                "pages": page_count,
-                "modified": metadata.get("lastModified", "")
-            })
+            self._update(doc_id, row, metadata_mtime, content_mtime, folder_mtime)
+            return True
         except Exception as e:
             print(f"  Error reading {doc_id}: {e}")
+            self._remove(doc_id)
+            return False
+
+    def _remove(self, doc_id: str):
+        self.conn.execute("DELETE FROM documents WHERE id = ?", (doc_id,))
+        self.conn.execute("DELETE FROM pages WHERE doc_id = ?", (doc_id,))
+
+    def _update(self, doc_id: str, row: sqlite3.Row | None,
+                metadata_mtime: int, content_mtime: int, folder_mtime: int):
+        """Re-read whichever of a document's files changed since row was stored."""
+        if row is None or row["metadata_mtime"] != metadata_mtime:
+            metadata = json.loads((self.data_dir / f"{doc_id}.metadata").read_text())
+            self.conn.execute(
+                "INSERT INTO documents (id, name, type, modified, page_count,"
+                " metadata_mtime, content_mtime, folder_mtime) VALUES (?, ?, ?, ?, 0, ?, -1, -1)"
+                " ON CONFLICT (id) DO UPDATE SET name = excluded.name, type = excluded.type,"
+                " modified = excluded.modified, metadata_mtime = excluded.metadata_mtime",
+                (doc_id, metadata.get("visibleName", "Unknown"), metadata.get("type", "Unknown"),
+                 int(metadata.get("lastModified") or 0), metadata_mtime),
+            )
+
+        if row is None or (row["content_mtime"], row["folder_mtime"]) != (content_mtime, folder_mtime):
+            doc_folder = self.data_dir / doc_id
+            page_count = 0
+            if doc_folder.is_dir():
+                with os.scandir(doc_folder) as entries:
+                    page_count = sum(1 for entry in entries if entry.name.endswith(".rm"))
+
+            content_file = self.data_dir / f"{doc_id}.content"
+            pages = []
+            if content_file.exists():
+                content = json.loads(content_file.read_text())
+                pages = content.get("cPages", {}).get("pages", [])
+
+            self.conn.execute("DELETE FROM pages WHERE doc_id = ?", (doc_id,))
+            self.conn.executemany(
+                "INSERT INTO pages (doc_id, position, id, template) VALUES (?, ?, ?, ?)",
+                [(doc_id, i, page.get("id", ""), page.get("template", {}).get("value", "Unknown"))
+                 for i, page in enumerate(pages)],
+            )
+            self.conn.execute(
+                "UPDATE documents SET page_count = ?, content_mtime = ?, folder_mtime = ? WHERE id = ?",
+                (page_count, content_mtime, folder_mtime, doc_id),
+            )
 
-    return sorted(documents, key=lambda d: d.get("modified", ""), reverse=True)
+    def documents(
+        self,
+        name: str | None = None,
+        sort: str = "modified",
+        limit: int | None = None,
+        offset: int = 0
+    ) -> list[dict]:
+        """Documents matching name (case-insensitive substring), sorted and paginated."""
+        where, params = self._name_filter(name)
+        rows = self.conn.execute(
+            f"SELECT id, name, type, page_count AS pages, modified FROM documents {where}"
+            f" ORDER BY {CATALOG_SORTS[sort]}, id LIMIT ? OFFSET ?",
+            (*params, -1 if limit is None else limit, offset),
+        )
+        return [dict(row) for row in rows]
+
+    def count(self, name: str | None = None) -> int:
+        """Number of documents matching name."""
+        where, params = self._name_filter(name)
+        return self.conn.execute(f"SELECT COUNT(*) FROM documents {where}", params).fetchone()[0]
+
+    @staticmethod
+    def _name_filter(name: str | None) -> tuple[str, tuple]:
+        if not name:
+            return "", ()
+        pattern = name.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+        return "WHERE name LIKE ? ESCAPE '\\'", (f"%{pattern}%",)
+
+    def pages(self, doc_id: str) -> list[dict]:
+        """Pages of a document in order; .rm sizes are read fresh."""
+        doc_folder = self.data_dir / doc_id
+        pages = []
+        for row in self.conn.execute(
+                "SELECT id, template FROM pages WHERE doc_id = ? ORDER BY position", (doc_id,)):
+            rm_file = doc_folder / f"{row['id']}.rm"
+            size = rm_file.stat().st_size if rm_file.exists() else 0
+            pages.append({
+                "id": row["id"],
+                "exists": rm_file.exists(),
+                "size": size,
+                "template": row["template"]
+            })
+        return pages
 
 
 def list_pages(doc_id: str) -> list[dict]:
     """List pages in a document."""
-    content_file = DESKTOP_DATA_DIR / f"{doc_id}.content"
-    doc_folder = DESKTOP_DATA_DIR / doc_id
-
-    if not content_file.exists():
-        return []
-
-    content = json.loads(content_file.read_text())
-    pages = []
-
-    for page in content.get("cPages", {}).get("pages", []):
-        page_id = page.get("id", "")
-        rm_file = doc_folder / f"{page_id}.rm"
-
-        pages.append({
-            "id": page_id,
-            "exists": rm_file.exists(),
-            "size": rm_file.stat().st_size if rm_file.exists() else 0,
-            "template": page.get("template", {}).get("value", "Unknown")
-        })
-
-    return pages
+    with DesktopCatalog() as catalog:
+        catalog.refresh_document(doc_id)
+        return catalog.pages(doc_id)
 
 
 def get_last_item_id(items: CrdtSequence) -> CrdtId:
@@ -138,7 +336,10 @@ def get_last_item_id(items: CrdtSequence) -> CrdtId:
     if not sequence_items:
         return CrdtId(0, 0)  # END_MARKER
 
-    # Find the last non-deleted item
+    # Find the last non-deleted item. This walk is linear in the page's edit
+    # history, but it runs on the tree the append has already parsed, and
+    # the page is rewritten in full afterwards. Caching the last ID by file
+    # hash would still need that parse, so the scan is kept.
     last_item = None
     for item in sequence_items:
         if item.deleted_length == 0 and item.value:
@@ -156,18 +357,27 @@ def get_last_item_id(items: CrdtSequence) -> CrdtId:
     return last_item.item_id
 
 
-def append_text_to_page(
+def separate(text: str) -> str:
+    """Prepend newlines if text doesn't start with one (to separate from existing)."""
+    return text if text.startswith("\n") else "\n\n" + text
+
+
+def append_texts_to_page(
     rm_path: Path,
-    text: str,
+    texts: list[str],
     state: CrdtState,
     dry_run: bool = False
 ) -> bool:
     """
-    Append text to an existing reMarkable page.
+    Append several texts to an existing reMarkable page in one write.
+
+    The page is read once, every text becomes a CRDT item chained after
+    the previous one, and the blocks are written back once (through a
+    temporary file). A single .rm.backup is made per call.
 
     Args:
         rm_path: Path to the .rm file
-        text: Text to append
+        texts: Texts to append, in order
         state: CRDT state for generating IDs
         dry_run: If True, don't actually write
 
@@ -178,12 +388,6 @@ def append_text_to_page(
         print(f"Error: File not found: {rm_path}")
         return False
 
-    # Backup the original file
-    backup_path = rm_path.with_suffix(".rm.backup")
-    if not dry_run:
-        shutil.copy(rm_path, backup_path)
-        print(f"  Backup created: {backup_path.name}")
-
     # Read all blocks from the file
     with open(rm_path, "rb") as f:
         blocks = list(read_blocks(f))
@@ -203,48 +407,161 @@ def append_text_to_page(
     last_id = get_last_item_id(root_text_block.value.items)
     print(f"  Last character ID: {last_id}")
 
-    # Create new CRDT item for the appended text
-    new_item_id = state.next_id()
-
-    # Prepend newlines if text doesn't start with one (to separate from existing)
-    if not text.startswith("\n"):
-        text = "\n\n" + text
+    new_items = []
+    for text in texts:
+        text = separate(text)
 
-    new_item = CrdtSequenceItem(
-        item_id=new_item_id,
-        left_id=last_id,
-        right_id=CrdtId(0, 0),  # END_MARKER
-        deleted_length=0,
-        value=text
-    )
+        # Create new CRDT item for the appended text, one ID per character
+        new_item_id = state.allocate(len(text))
+        new_items.append(CrdtSequenceItem(
+            item_id=new_item_id,
+            left_id=last_id,
+            right_id=CrdtId(0, 0),  # END_MARKER
+            deleted_length=0,
+            value=text
+        ))
+        last_id = CrdtId(new_item_id.part1, new_item_id.part2 + len(text) - 1)
 
-    print(f"  New item ID: {new_item_id}")
-    print(f"  Text to append: {repr(text[:50])}{'...' if len(text) > 50 else ''}")
+        print(f"  New item ID: {new_item_id}")
+        print(f"  Text to append: {repr(text[:50])}{'...' if len(text) > 50 else ''}")
 
     if dry_run:
-        print("\n  [DRY RUN] Would append text but not writing.")
+        print(f"\n  [DRY RUN] Would append {len(new_items)} item(s) but not writing.")
         return True
 
-    # Add the new item to the text sequence
-    root_text_block.value.items.add(new_item)
+    # Backup the original file
+    backup_path = rm_path.with_suffix(".rm.backup")
+    shutil.copy(rm_path, backup_path)
+    print(f"  Backup created: {backup_path.name}")
+
+    # Add the new items to the text sequence
+    for new_item in new_items:
+        root_text_block.value.items.add(new_item)
 
     # Write all blocks back to file
-    with open(rm_path, "wb") as f:
+    tmp_path = rm_path.with_suffix(".rm.tmp")
+    with open(tmp_path, "wb") as f:
         write_blocks(f, blocks)
+    os.replace(tmp_path, rm_path)
 
     print(f"  Successfully wrote to: {rm_path.name}")
     return True
 
 
+def append_text_to_page(
+    rm_path: Path,
+    text: str,
+    state: CrdtState,
+    dry_run: bool = False
+) -> bool:
+    """
+    Append text to an existing reMarkable page.
+
+    Args:
+        rm_path: Path to the .rm file
+        text: Text to append
+        state: CRDT state for generating IDs
+        dry_run: If True, don't actually write
+
+    Returns:
+        True if successful
+    """
+    return append_texts_to_page(rm_path, [text], state, dry_run=dry_run)
+
+
+def apply_text_operations(
+    operations: list[TextOperation],
+    state: CrdtState,
+    state_file: Path = STATE_FILE,
+    dry_run: bool = False
+) -> dict[str, int]:
+    """
+    Apply many text appends with one read-modify-write per page.
+
+    Operations are grouped by (document, page), keeping their order within
+    each page. IDs for the whole batch are reserved as one block and the
+    state file is saved once, before any page is written, so a failure
+    part-way through never hands out the same IDs twice.
+
+    Returns:
+        Counts of operations and pages written or failed
+    """
+    pages: dict[tuple[str, str], list[str]] = defaultdict(list)
+    for op in operations:
+        pages[(op.doc_id, op.page_id)].append(op.text)
+
+    # Reserve every ID this batch can use, and flush the state once
+    first = state.allocate(sum(len(separate(op.text)) for op in operations))
+    if not dry_run:
+        state.save(state_file)
+    block = CrdtState(author_id=state.author_id, last_sequence=first.part2 - 1)
+
+    stats = {"operations": len(operations), "pages": 0, "failed_pages": 0}
+    for (doc_id, page_id), texts in pages.items():
+        print(f"\n{doc_id}/{page_id}: {len(texts)} item(s)")
+        rm_path = DESKTOP_DATA_DIR / doc_id / f"{page_id}.rm"
+        if append_texts_to_page(rm_path, texts, block, dry_run=dry_run):
+            stats["pages"] += 1
+        else:
+            stats["failed_pages"] += 1
+
+    return stats
+
+
+def load_operations(source: str) -> list[TextOperation]:
+    """
+    Read batch operations from a JSON/JSON Lines file, or stdin for "-".
+
+    Every record is checked before any page is written. A malformed one
+    raises ValueError naming its line (or, in a JSON list, its position).
+    """
+    raw = sys.stdin.read() if source == "-" else Path(source).read_text()
+    name = "stdin" if source == "-" else source
+    if raw.strip().startswith("["):
+        try:
+            records = [(f"record {i}", r) for i, r in enumerate(json.loads(raw), 1)]
+        except json.JSONDecodeError as e:
+            raise ValueError(f"{name}, line {e.lineno}: invalid JSON: {e.msg}")
+    else:
+        records = []
+        for lineno, line in enumerate(raw.splitlines(), 1):
+            if not line.strip():
+                continue
+            try:
+                records.append((f"line {lineno}", json.loads(line)))
+            except json.JSONDecodeError as e:
+                raise ValueError(f"{name}, line {lineno}: invalid JSON: {e.msg}")
+
+    operations = []
+    for where, record in records:
+        if not isinstance(record, dict):
+            raise ValueError(f"{name}, {where}: expected an object with doc, page and text")
+        missing = [field for field in ("doc", "page", "text") if field not in record]
+        if missing:
+            raise ValueError(f"{name}, {where}: missing {', '.join(missing)}")
+        wrong = [field for field in ("doc", "page", "text") if not isinstance(record[field], str)]
+        if wrong:
+            raise ValueError(f"{name}, {where}: {', '.join(wrong)} must be a string")
+        operations.append(TextOperation(record["doc"], record["page"], record["text"]))
+    return operations
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="Write text to a reMarkable document (proof-of-concept)"
     )
     parser.add_argument("--list", action="store_true", help="List available documents")
     parser.add_argument("--pages", metavar="DOC_ID", help="List pages in a document")
+    parser.add_argument("--name", help="With --list: only documents whose name contains this")
+    parser.add_argument("--sort", choices=sorted(CATALOG_SORTS), default="modified",
+                        help="With --list: sort order (default: modified)")
+    parser.add_argument("--limit", type=int, default=20, help="With --list: documents to show (default: 20)")
+    parser.add_argument("--offset", type=int, default=0, help="With --list: documents to skip")
     parser.add_argument("--dry-run", action="store_true", help="Preview without writing")
     parser.add_argument("--author-id", type=int, default=DEFAULT_AUTHOR_ID,
                         help=f"CRDT author ID (default: {DEFAULT_AUTHOR_ID})")
+    parser.add_argument("--batch", metavar="FILE",
+                        help="Apply {doc, page, text} operations from a JSON/JSONL file ('-' for stdin)")
     parser.add_argument("doc_id", nargs="?", help="Document UUID")
     parser.add_argument("page_id", nargs="?", help="Page UUID")
     parser.add_argument("text", nargs="?", help="Text to append")
@@ -253,12 +570,20 @@ def main():
 
     if args.list:
         print("=== Available Documents ===\n")
-        documents = list_documents()
-        for doc in documents[:20]:
+        if not DESKTOP_DATA_DIR.exists():
+            print(f"Desktop data directory not found: {DESKTOP_DATA_DIR}")
+            return
+        with DesktopCatalog() as catalog:
+            catalog.refresh()
+            total = catalog.count(args.name)
+            documents = catalog.documents(args.name, args.sort, args.limit, args.offset)
+        for doc in documents:
             print(f"  {doc['name']}")
             print(f"    ID: {doc['id']}")
             print(f"    Pages: {doc['pages']}, Type: {doc['type']}")
             print()
+        if documents:
+            print(f"  Showing {args.offset + 1}-{args.offset + len(documents)} of {total}")
         return
 
     if args.pages:
@@ -272,12 +597,31 @@ def main():
             print()
         return
 
+    if args.batch:
+        try:
+            operations = load_operations(args.batch)
+        except ValueError as e:
+            print(f"Error: {e}")
+            sys.exit(1)
+        state = CrdtState.load(STATE_FILE, args.author_id)
+        print(f"=== Writing {len(operations)} Text Item(s) to reMarkable ===")
+        print(f"  Author ID: {state.author_id}")
+        print(f"  Starting sequence: {state.last_sequence}")
+
+        stats = apply_text_operations(operations, state, dry_run=args.dry_run)
+        print(f"\n  {stats['operations']} item(s) on {stats['pages']} page(s)"
+              + (f", {stats['failed_pages']} page(s) failed" if stats["failed_pages"] else ""))
+        if not args.dry_run:
+            print(f"  State saved. New sequence: {state.last_sequence}")
+        return
+
     if not all([args.doc_id, args.page_id, args.text]):
         parser.print_help()
         print("\nExamples:")
         print("  python write-text-poc.py --list")
         print("  python write-text-poc.py --pages <doc-uuid>")
         print("  python write-text-poc.py --dry-run <doc-uuid> <page-uuid> 'Hello World'")
+        print("  python write-text-poc.py --batch agenda.jsonl")
         return
 
     # Load CRDT state
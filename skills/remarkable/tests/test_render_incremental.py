@@ -0,0 +1,122 @@
+"""
+Incremental re-renders must match a --force render.
+
+render-annotations.py reuses unchanged pages from the previous output and
+restores edited pages from the source PDF. Restoring a page must keep
+the outline entries and links that point at it.
+
+Run with:
+    python -m pytest skills/remarkable/tests
+"""
+
+import importlib.util
+import io
+import json
+import sys
+import uuid
+import zipfile
+from pathlib import Path
+
+import pytest
+
+SCRIPTS_DIR = Path(__file__).parent.parent / "assets" / "scripts"
+sys.path.insert(0, str(SCRIPTS_DIR))
+
+fitz = pytest.importorskip("fitz")
+pytest.importorskip("numpy")
+pytest.importorskip("rmscene")
+
+from rmscene import CrdtId, write_blocks  # noqa: E402
+from rmscene import scene_items as si  # noqa: E402
+from rmscene.crdt_sequence import CrdtSequenceItem  # noqa: E402
+from rmscene.scene_stream import (  # noqa: E402
+    AuthorIdsBlock,
+    MigrationInfoBlock,
+    PageInfoBlock,
+    SceneGroupItemBlock,
+    SceneLineItemBlock,
+    SceneTreeBlock,
+    TreeNodeBlock,
+)
+from rmscene.tagged_block_common import LwwValue  # noqa: E402
+
+spec = importlib.util.spec_from_file_location("render_annotations", SCRIPTS_DIR / "render-annotations.py")
+render_annotations = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(render_annotations)
+
+DOC_ID = "11111111-2222-3333-4444-555555555555"
+PAGE_IDS = [f"aaaaaaaa-0000-0000-0000-{i:012d}" for i in range(3)]
+
+
+def rm_page(offset: float) -> bytes:
+    """A v6 page with one ballpoint stroke, shifted by offset."""
+    blocks = [
+        AuthorIdsBlock(author_uuids={1: uuid.UUID(int=1)}),
+        MigrationInfoBlock(migration_id=CrdtId(1, 1), is_device=True),
+        PageInfoBlock(loads_count=1, merges_count=0, text_chars_count=0, text_lines_count=0),
+        SceneTreeBlock(tree_id=CrdtId(0, 11), node_id=CrdtId(0, 0), is_update=True, parent_id=CrdtId(0, 1)),
+        TreeNodeBlock(si.Group(node_id=CrdtId(0, 1))),
+        TreeNodeBlock(si.Group(node_id=CrdtId(0, 11), label=LwwValue(CrdtId(0, 12), "Layer 1"))),
+        SceneGroupItemBlock(parent_id=CrdtId(0, 1), item=CrdtSequenceItem(
+            item_id=CrdtId(0, 13), left_id=CrdtId(0, 0), right_id=CrdtId(0, 0),
+            deleted_length=0, value=CrdtId(0, 11))),
+    ]
+    points = [si.Point(100 + offset + 10 * i, 200 + 5 * i, 10, 10, 0, 128) for i in range(20)]
+    line = si.Line(color=si.PenColor.BLACK, tool=si.Pen.BALLPOINT_2, points=points,
+                   thickness_scale=2.0, starting_length=0.0)
+    blocks.append(SceneLineItemBlock(parent_id=CrdtId(0, 11), item=CrdtSequenceItem(
+        item_id=CrdtId(1, 100), left_id=CrdtId(0, 0), right_id=CrdtId(0, 0),
+        deleted_length=0, value=line)))
+    buf = io.BytesIO()
+    write_blocks(buf, blocks)
+    return buf.getvalue()
+
+
+def source_pdf() -> bytes:
+    """Three pages with an outline and a GoTo link from page 0 to page 1."""
+    pdf = fitz.open()
+    for i in range(len(PAGE_IDS)):
+        pdf.new_page(width=595, height=842).insert_text((72, 72), f"Chapter {i + 1}")
+    pdf.set_toc([[1, "Chapter 1", 1], [1, "Chapter 2", 2], [1, "Chapter 3", 3]])
+    pdf[0].insert_link({"kind": fitz.LINK_GOTO, "from": fitz.Rect(72, 100, 200, 120),
+                        "page": 1, "to": fitz.Point(0, 0)})
+    return pdf.tobytes()
+
+
+# Built once, so both versions of the document share the same source PDF
+SOURCE_PDF = source_pdf()
+
+
+def write_document(path: Path, offsets: list[float]) -> None:
+    with zipfile.ZipFile(path, "w") as archive:
+        archive.writestr(f"{DOC_ID}.content", json.dumps(
+            {"fileType": "pdf", "cPages": {"pages": [{"id": page_id} for page_id in PAGE_IDS]}}))
+        archive.writestr(f"{DOC_ID}.metadata", json.dumps({"visibleName": "Test"}))
+        archive.writestr(f"{DOC_ID}.pdf", SOURCE_PDF)
+        for page_id, offset in zip(PAGE_IDS, offsets):
+            archive.writestr(f"{DOC_ID}/{page_id}.rm", rm_page(offset))
+
+
+def structure(path: Path) -> tuple:
+    with fitz.open(path) as pdf:
+        links = [[(link["kind"], link.get("page")) for link in page.get_links()] for page in pdf]
+        return pdf.get_toc(), links
+
+
+def test_incremental_render_keeps_outline_and_links(tmp_path):
+    document = tmp_path / "doc.zip"
+    incremental = tmp_path / "incremental.pdf"
+    forced = tmp_path / "forced.pdf"
+
+    write_document(document, [0, 0, 0])
+    render_annotations.render_to_pdf(document, incremental)
+
+    # Edit the page that the outline and the link point at
+    write_document(document, [0, 300, 0])
+    render_annotations.render_to_pdf(document, incremental)
+    render_annotations.render_to_pdf(document, forced, force=True)
+
+    assert structure(incremental) == structure(forced)
+    toc, links = structure(incremental)
+    assert [entry[2] for entry in toc] == [1, 2, 3]
+    assert links[0] == [(fitz.LINK_GOTO, 1)]